@@ -15,6 +15,7 @@ from tkinter import messagebox
 import yaml
 
 from app.config import fetch_response
+from app.core.network_simulation import shutdown_simulation_pool
 from app.frames import (
     init_create_model_frame,
     init_home_frame,
@@ -49,7 +50,7 @@ def show_menu(app: tk.Tk):
     # File menu
     file_menu = tk.Menu(menu_bar, tearoff=0)
     file_menu.add_command(
-        label="Home", command=lambda: switch_frame(FRAME_STORE["home"])
+        label="Home", command=lambda: switch_frame(FRAME_STORE.home)
     )
     file_menu.add_separator()
     file_menu.add_command(label="Exit", command=lambda: sys.exit(0))
@@ -80,7 +81,7 @@ def check_access(app: tk.Tk, trail=True):  #! trail=False in production
 
     if status == "OK":
         # Access granted
-        switch_frame(FRAME_STORE["home"])
+        switch_frame(FRAME_STORE.home)
     elif status == "error":
         # Connection error occurred
         messagebox.showerror(
@@ -88,7 +89,7 @@ def check_access(app: tk.Tk, trail=True):  #! trail=False in production
             f"Failed to connect to the server: {response.get('message', 'Unknown error')}",
         )
         access_denied(app)
-        switch_frame(FRAME_STORE["access_denied"])
+        switch_frame(FRAME_STORE.access_denied)
     else:
         # Access denied
         messagebox.showwarning(
@@ -96,13 +97,13 @@ def check_access(app: tk.Tk, trail=True):  #! trail=False in production
             "You do not have permission to access this feature.",
         )
         access_denied(app)
-        switch_frame(FRAME_STORE["access_denied"])
+        switch_frame(FRAME_STORE.access_denied)
 
 
 def access_denied(app: tk.Tk):
     """Create and display the access denied frame."""
     access_frame = tk.Frame(app)
-    FRAME_STORE["access_denied"] = access_frame
+    FRAME_STORE.access_denied = access_frame
     access_label = tk.Label(access_frame, text="Access Denied", font=("Arial", 14))
     access_label.pack(pady=10)
     reason_label = tk.Label(
@@ -148,7 +149,10 @@ def launch_application():
     # Check access
     check_access(app)
 
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        shutdown_simulation_pool()
 
 
 if __name__ == "__main__":
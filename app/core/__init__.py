@@ -29,6 +29,10 @@ class NetworkSimulationError(Exception):
     def __str__(self):
         return f"Simulation Error: {self.args[0]} (Model: {self.model_path})"
 
+    def __reduce__(self):
+        # Keep model_path when the error is sent back from a worker process.
+        return (self.__class__, (self.args[0], self.model_path))
+
 
 from .excel_handling import ExcelHandler
 from .input_validation import PipSimInput
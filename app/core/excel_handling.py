@@ -2,8 +2,11 @@
 """
 This module contains the ExcelHandler class for reading and writing to Excel files.
 """
+import importlib.util
 import logging
 import os
+import xml.etree.ElementTree as ET
+import zipfile
 
 # import traceback
 from pathlib import Path
@@ -11,12 +14,32 @@ from typing import Optional
 
 import pandas as pd
 import xlwings as xw
+from openpyxl import load_workbook
 from openpyxl.utils import column_index_from_string
 from xlwings import constants as xw_const
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # optional, openpyxl is used instead
+    CalamineWorkbook = None
+
 logger = logging.getLogger("ExcelHandler")
 
 
+def _get_read_engine() -> Optional[str]:
+    """
+    Returns "calamine" when pandas can read workbooks with the Rust-based
+    python-calamine package, otherwise None to keep the pandas default engine.
+    """
+    pandas_version = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    if pandas_version >= (2, 2) and importlib.util.find_spec("python_calamine"):
+        return "calamine"
+    return None
+
+
+EXCEL_READ_ENGINE = _get_read_engine()
+
+
 class ExcelHandlerError(Exception):
     """Base class for exceptions in this module."""
 
@@ -66,13 +89,18 @@ class ExcelHandler:
             header=1,
             index_col=0,
             usecols="A:E",
+            engine=EXCEL_READ_ENGINE,
         )
         return conditions
 
     def get_all_profiles(self, sheet_name="PIPSIM Input"):
 
         profiles = pd.read_excel(
-            self.excel_path, sheet_name=sheet_name, header=3, index_col=0
+            self.excel_path,
+            sheet_name=sheet_name,
+            header=3,
+            index_col=0,
+            engine=EXCEL_READ_ENGINE,
         )
         return profiles
 
@@ -85,6 +113,7 @@ class ExcelHandler:
         clear_sheet: bool = False,
         save: bool = True,
         only_values: bool = False,
+        units: Optional[pd.DataFrame] = None,
     ):
         try:
             app = xw.App(visible=not save)
@@ -103,6 +132,12 @@ class ExcelHandler:
                 ws.clear_contents()
             if only_values:
                 ws.range(sht_range).value = df.values
+            elif units is not None:
+                # Units go between the header and the data so df stays numeric.
+                ws.range(sht_range).value = units.reindex(columns=df.columns)
+                ws.range(sht_range).offset(row_offset=len(units) + 1).options(
+                    header=False
+                ).value = df
             else:
                 ws.range(sht_range).value = df
             if save:
@@ -111,6 +146,125 @@ class ExcelHandler:
         except ExcelHandlerError as e:
             logging.error(f"Error writing to Excel: {str(e)}")
 
+    @staticmethod
+    def write_sheets(
+        workbook: str,
+        frames: dict[str, pd.DataFrame],
+        sht_range: str = "A2",
+        clear_sheet: bool = False,
+        write_sheet_name: bool = False,
+        units: Optional[dict[str, pd.DataFrame]] = None,
+    ) -> None:
+        """
+        Writes DataFrames to the sheets of a workbook with openpyxl in a single
+        open-save cycle, without starting an Excel instance.
+
+        Args:
+            workbook (str): Path to the workbook. It is created if it does not exist.
+            frames (dict[str, pd.DataFrame]): DataFrames to write, keyed by sheet name.
+            sht_range (str): Top-left cell where each DataFrame is written.
+            clear_sheet (bool): Replace existing sheets instead of writing over them.
+            write_sheet_name (bool): Write the sheet name into cell A1.
+            units (Optional[dict[str, pd.DataFrame]]): Rows written between the
+                header and the data of a sheet, keyed by sheet name.
+
+        Raises:
+            ExcelHandlerError: If the workbook cannot be written.
+        """
+        cell = ExcelHandler.split_cell_reference(sht_range)
+        append = os.path.isfile(workbook)
+        try:
+            with pd.ExcelWriter(
+                workbook,
+                engine="openpyxl",
+                mode="a" if append else "w",
+                if_sheet_exists=(
+                    ("replace" if clear_sheet else "overlay") if append else None
+                ),
+            ) as writer:
+                for sheet_name, df in frames.items():
+                    sheet_units = (units or {}).get(sheet_name)
+                    if len(sheet_name) > 30:
+                        sheet_name = sheet_name[:30]
+                        logger.warning(
+                            f"Sheet name too long. Truncated to {sheet_name}"
+                        )
+                    startrow = cell["row"] - 1
+                    if sheet_units is not None:
+                        startrow += len(sheet_units) + 1
+                    df.to_excel(
+                        writer,
+                        sheet_name=sheet_name,
+                        startrow=startrow,
+                        startcol=cell["column"] - 1,
+                        header=sheet_units is None,
+                    )
+                    if sheet_units is not None:
+                        ExcelHandler._write_units(
+                            writer.sheets[sheet_name], df, sheet_units, cell
+                        )
+                    if write_sheet_name:
+                        writer.sheets[sheet_name].cell(row=1, column=1).value = (
+                            sheet_name
+                        )
+        except (OSError, ValueError) as e:
+            raise ExcelHandlerError(
+                f"Error writing to Excel: {e}", Path(workbook)
+            ) from e
+
+    @staticmethod
+    def _write_units(
+        ws, df: pd.DataFrame, units: pd.DataFrame, cell: dict[str, int]
+    ) -> None:
+        """Writes the header of df followed by its units rows, starting at cell."""
+        units = units.reindex(columns=df.columns).astype(object)
+        rows = [[df.index.name, *df.columns]] + [
+            [index, *values] for index, values in zip(units.index, units.to_numpy())
+        ]
+        for row_offset, values in enumerate(rows):
+            for col_offset, value in enumerate(values):
+                ws.cell(
+                    row=cell["row"] + row_offset,
+                    column=cell["column"] + col_offset,
+                    value=None if pd.isna(value) else value,
+                )
+
+    @staticmethod
+    def _read_workbook_xml_sheet_names(workbook: str) -> list[str]:
+        """Returns the sheet names listed in xl/workbook.xml of an .xlsx/.xlsm file."""
+        try:
+            with zipfile.ZipFile(workbook) as archive:
+                root = ET.fromstring(archive.read("xl/workbook.xml"))
+        except (zipfile.BadZipFile, KeyError, ET.ParseError):
+            return []
+        return [
+            element.attrib["name"]
+            for element in root.iter()
+            if element.tag.rpartition("}")[2] == "sheet" and "name" in element.attrib
+        ]
+
+    @staticmethod
+    def get_sheet_names(workbook: str) -> list[str]:
+        """
+        Returns the sheet names of a workbook without loading its cells.
+        Reads xl/workbook.xml straight from the archive, and falls back to
+        python-calamine when installed, otherwise openpyxl in read-only mode.
+        """
+        sheet_names = ExcelHandler._read_workbook_xml_sheet_names(workbook)
+        if sheet_names:
+            return sheet_names
+        if CalamineWorkbook is not None:
+            calamine_wb = CalamineWorkbook.from_path(workbook)
+            try:
+                return list(calamine_wb.sheet_names)
+            finally:
+                calamine_wb.close()
+        wb = load_workbook(workbook, read_only=True, keep_links=False)
+        try:
+            return wb.sheetnames
+        finally:
+            wb.close()
+
     @staticmethod
     def format_excel_general(workbook: xw.Book, sheet_name):
         try:
@@ -9,7 +9,7 @@ from itertools import product
 
 import pandas as pd
 
-from app.core.excel_handling import ExcelHandler
+from app.core.excel_handling import EXCEL_READ_ENGINE, ExcelHandler
 
 
 @dataclass
@@ -64,6 +64,7 @@ class InputData:
                 sheet_name=sheet_name,
                 header=row_col["row"] - 1,
                 index_col=row_col["column"] - 1,
+                engine=EXCEL_READ_ENGINE,
             )
             df.reset_index(inplace=True)
             return df
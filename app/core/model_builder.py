@@ -1,16 +1,29 @@
 """This module creates the components for the Pipsim model from an Excel file."""
 
+import importlib.util
 import logging
-from typing import List, Literal, NamedTuple, Optional
+import os
+import threading
+import time
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import List, Literal, NamedTuple, Optional, Sequence
 
 import pandas as pd
 from sixgill.definitions import Parameters, Units
 from sixgill.pipesim import Model, ModelComponents
 
 from app.core import ExcelInputError
+from app.core.excel_handling import EXCEL_READ_ENGINE
 
 logger = logging.getLogger(__name__)
 
+SHEET_CACHE_DIR = Path.home() / ".cache" / "pandora"
+SHEET_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds since last use
+# Feather needs pyarrow; without it sheets are always parsed from the workbook.
+SHEET_CACHE_ENABLED = importlib.util.find_spec("pyarrow") is not None
+
 
 class PipsimComponents(NamedTuple):
     """
@@ -25,6 +38,79 @@ class PipsimComponents(NamedTuple):
     type: str
 
 
+def _sheet_cache_path(
+    excel_file_path: str, sheet_name: str, mtime: float, size: int
+) -> Path:
+    key = f"{os.path.abspath(excel_file_path)}|{sheet_name}|{mtime}|{size}"
+    digest = blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return SHEET_CACHE_DIR / f"{digest}.feather"
+
+
+def _write_sheet_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """Stores a parsed sheet and removes cache entries unused for too long."""
+    tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+    try:
+        SHEET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_feather(tmp_path)
+        os.replace(tmp_path, cache_path)
+
+        cutoff = time.time() - SHEET_CACHE_MAX_AGE
+        for entry in SHEET_CACHE_DIR.iterdir():
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink(missing_ok=True)
+    except Exception as e:  # e.g. mixed-type or non-string columns Arrow rejects
+        tmp_path.unlink(missing_ok=True)
+        logger.warning(f"Could not write sheet cache {cache_path}: {e}")
+
+
+@lru_cache(maxsize=2)
+def _read_sheet(
+    excel_file_path: str, sheet_name: str, mtime: float, size: int
+) -> pd.DataFrame:
+    if not SHEET_CACHE_ENABLED:
+        return pd.read_excel(
+            excel_file_path, sheet_name=sheet_name, engine=EXCEL_READ_ENGINE
+        )
+
+    cache_path = _sheet_cache_path(excel_file_path, sheet_name, mtime, size)
+    try:
+        df = pd.read_feather(cache_path)
+        os.utime(cache_path)
+        return df
+    except FileNotFoundError:
+        pass
+    except Exception as e:  # a corrupt or incompatible entry is re-read from Excel
+        logger.warning(f"Ignoring sheet cache {cache_path}: {e}")
+
+    df = pd.read_excel(
+        excel_file_path, sheet_name=sheet_name, engine=EXCEL_READ_ENGINE
+    )
+    threading.Thread(
+        target=_write_sheet_cache, args=(df, cache_path), daemon=True
+    ).start()
+    return df
+
+
+def read_sheet(excel_file_path: str, sheet_name: str) -> pd.DataFrame:
+    """
+    Read a sheet of the Excel file. Repeated reads of an unchanged file are served
+    from memory, or from a Feather file under SHEET_CACHE_DIR in later sessions
+    when pyarrow is installed; both caches are keyed on the file's modification
+    time and size.
+
+    Args:
+        excel_file_path (str): The path to the Excel file.
+        sheet_name (str): The name of the sheet to read.
+
+    Returns:
+        pd.DataFrame: A copy of the sheet data, safe for the caller to modify.
+    """
+    stat = os.stat(excel_file_path)
+    return _read_sheet(
+        excel_file_path, sheet_name, stat.st_mtime, stat.st_size
+    ).copy()
+
+
 def create_component_name_df(excel_file_path: str, sheet_name: str) -> pd.DataFrame:
     """
     Create a DataFrame from the component names in the Excel file.
@@ -36,7 +122,7 @@ def create_component_name_df(excel_file_path: str, sheet_name: str) -> pd.DataFr
     Returns:
         pd.DataFrame: A DataFrame containing the component names.
     """
-    component_name = pd.read_excel(excel_file_path, sheet_name=sheet_name)
+    component_name = read_sheet(excel_file_path, sheet_name)
 
     if len(component_name.columns) % 2 != 0:
         logger.warning(
@@ -46,6 +132,51 @@ def create_component_name_df(excel_file_path: str, sheet_name: str) -> pd.DataFr
     return component_name
 
 
+def check_sheet_columns(
+    excel_file_path: str,
+    sheet_name: str,
+    required_columns: Sequence[str] = (),
+    min_columns: int = 0,
+) -> None:
+    """
+    Check the header of a sheet before any model is opened.
+
+    Only the header row is parsed, so a wrong sheet fails in milliseconds instead of
+    after Pipesim has opened and partially built the model.
+
+    Args:
+        excel_file_path (str): The path to the Excel file.
+        sheet_name (str): The name of the sheet to check.
+        required_columns (Sequence[str]): Columns that must be present.
+        min_columns (int): Minimum number of columns the sheet must have.
+
+    Raises:
+        ExcelInputError: If the sheet cannot be read or does not have the expected
+            columns.
+    """
+    try:
+        columns = pd.read_excel(
+            excel_file_path, sheet_name=sheet_name, nrows=0, engine=EXCEL_READ_ENGINE
+        ).columns
+    except (ValueError, OSError) as e:  # bad path, missing sheet, not a workbook
+        raise ExcelInputError(
+            f"Could not read the sheet: {e}", excel_file_path, sheet_name
+        ) from e
+    missing = [col for col in required_columns if col not in columns]
+    if missing:
+        raise ExcelInputError(
+            f"Missing required columns: {', '.join(missing)}",
+            excel_file_path,
+            sheet_name,
+        )
+    if len(columns) < min_columns:
+        raise ExcelInputError(
+            f"Expected at least {min_columns} columns, found {len(columns)}",
+            excel_file_path,
+            sheet_name,
+        )
+
+
 class ModelBuilder:
     """
     Class for creating the components for the Pipsim model from an Excel file.
@@ -72,6 +203,7 @@ class ModelBuilder:
             else None
         )
         self.mode = mode
+        self._values_cache: dict = {}
 
         if mode == "Populate" and self.component_data is None:
             logger.warning("Component data is None, but mode is 'Populate'.")
@@ -115,6 +247,8 @@ class ModelBuilder:
         if self.component_data is None:
             raise ValueError("component_data is None. Cannot set new parameters.")
 
+        pending_updates: dict = {}
+        updated_components = []
         for component in self.component_data["Component"].unique():
             new_parameters = self._get_new_parameters(component)
             if not new_parameters:
@@ -123,7 +257,15 @@ class ModelBuilder:
                 )
                 continue
 
-            self.model.set_values(dict=new_parameters)
+            pending_updates.update(new_parameters)
+            updated_components.append(component)
+
+        if not pending_updates:
+            return
+
+        self.model.set_values(dict=pending_updates)
+        for component in updated_components:
+            self._values_cache.pop(component, None)
             logger.info(f"New parameters set for component - {component}")
 
     def set_flowline_elevations(self) -> None:
@@ -133,14 +275,27 @@ class ModelBuilder:
 
         flowlines_xl = self.component_data[
             self.component_data["Component"] == ModelComponents.FLOWLINE
-        ]["Name"]
+        ].drop_duplicates(subset="Name")
 
-        flowlines_model = list(
-            self.model.get_values(component=ModelComponents.FLOWLINE).keys()
-        )
+        flowlines_model = list(self._get_values(ModelComponents.FLOWLINE).keys())
 
-        for flowline in set(flowlines_xl).intersection(flowlines_model):
-            self._set_flowline_elevation(flowline)
+        try:
+            elevations = dict(
+                zip(
+                    flowlines_xl["Name"],
+                    zip(
+                        flowlines_xl["Start Elevation"],
+                        flowlines_xl["End Elevation"],
+                        flowlines_xl["Measured Distance"],
+                    ),
+                )
+            )
+        except KeyError as ke:
+            logger.error(f"KeyError: {ke}")
+            return
+
+        for flowline in set(elevations).intersection(flowlines_model):
+            self._set_flowline_elevation(flowline, *elevations[flowline])
         logger.info(f"Flowline elevation set for {len(flowlines_xl)} flowlines")
 
     def insert_junctions(
@@ -166,7 +321,7 @@ class ModelBuilder:
         j_counter = 1
         previous_row = None
 
-        for index, row in df.iterrows():
+        for index, row in zip(df.index, df.to_dict("records")):
             if index == 0 and row[type_column] == "Flowline":
                 # Check and add a junction at the beginning if the first row is a Flowline
                 new_rows.append(
@@ -191,8 +346,8 @@ class ModelBuilder:
                 )
                 j_counter += 1
 
-            new_rows.append(row.to_dict())
-            previous_row = row.to_dict()  # Update the previous row
+            new_rows.append(row)
+            previous_row = row  # Update the previous row
 
         if df.iloc[-1][type_column] == "Flowline":
             # Check and add a junction at the end if the last row is a Flowline
@@ -205,32 +360,28 @@ class ModelBuilder:
 
         return pd.DataFrame(new_rows)
 
-    def _set_flowline_elevation(self, flowline: str):
-        try:
-            if self.component_data is None:
-                raise ValueError(
-                    "component_data is None. Cannot set flowline elevation."
-                )
+    def _set_flowline_elevation(
+        self,
+        flowline: str,
+        start_elevation: float,
+        end_elevation: float,
+        measured_distance: float,
+    ) -> None:
+        b = [0, measured_distance]
+        n_df = pd.DataFrame(
+            {
+                Parameters.Flowline.HORIZONTALDISTANCE: b,
+                Parameters.Flowline.MEASUREDDISTANCE: b,
+                Parameters.Flowline.ELEVATION: [start_elevation, end_elevation],
+            }
+        )
+        self.model.set_geometry(Flowline=flowline, value=n_df)
 
-            dff = self.component_data.loc[
-                self.component_data["Name"] == flowline,
-                ["Start Elevation", "End Elevation", "Measured Distance"],
-            ]
-            a = [
-                dff["Start Elevation"].values[0],
-                dff["End Elevation"].values[0],
-            ]
-            b = [0, dff["Measured Distance"].values[0]]
-            n_df = pd.DataFrame(
-                {
-                    Parameters.Flowline.HORIZONTALDISTANCE: b,
-                    Parameters.Flowline.MEASUREDDISTANCE: b,
-                    Parameters.Flowline.ELEVATION: a,
-                }
-            )
-            self.model.set_geometry(Flowline=flowline, value=n_df)
-        except KeyError as ke:
-            logger.error(f"KeyError: {ke}")
+    def _get_values(self, component: str) -> dict:
+        """Returns the model values of a component type, fetched once until set."""
+        if component not in self._values_cache:
+            self._values_cache[component] = self.model.get_values(component=component)
+        return self._values_cache[component]
 
     def _get_new_parameters(self, component: str) -> Optional[dict]:
         """Get new parameters for a component from isometric data."""
@@ -238,7 +389,8 @@ class ModelBuilder:
             logger.error("component_data is None. Cannot retrieve parameters.")
             return None
 
-        component_names = list(self.model.get_values(component=component).keys())
+        component_values = self._get_values(component)
+        component_names = list(component_values.keys())
         filtered_isometric_data = self.component_data[
             (self.component_data["Component"] == component)
             & self.component_data["Name"].isin(component_names)
@@ -256,9 +408,7 @@ class ModelBuilder:
                 f"Extra names in isometric data for component {component}: {extra_names}"
             )
 
-        available_parameters = set(
-            pd.DataFrame(self.model.get_values(component=component)).index
-        )
+        available_parameters = set(pd.DataFrame(component_values).index)
         required_parameters = available_parameters.intersection(
             filtered_isometric_data.columns
         )
@@ -267,11 +417,18 @@ class ModelBuilder:
             logger.warning(f"No matching parameters found for component {component}.")
             return None
 
-        return (
-            filtered_isometric_data[list(required_parameters)]
-            .set_index("Name")
-            .to_dict("index")
-        )
+        columns = [
+            col
+            for col in filtered_isometric_data.columns
+            if col in required_parameters and col != "Name"
+        ]
+        return {
+            name: dict(zip(columns, values))
+            for name, values in zip(
+                filtered_isometric_data["Name"],
+                filtered_isometric_data[columns].itertuples(index=False, name=None),
+            )
+        }
 
     def create_section_components(self) -> None:
         """
@@ -314,6 +471,7 @@ class ModelBuilder:
             )
 
     def add_components(self, component, name, x=None, y=None) -> None:
+        self._values_cache.pop(component, None)
         try:
             if (
                 x is not None
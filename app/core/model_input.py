@@ -40,7 +40,7 @@ class PipsimModel:
     model_path: str = field(init=False)
     model: Model = field(init=False)
 
-    FILENAME_PATTERN = r"([^_]+)_([^_]+)_([^.]+)(.[a-z]*)"
+    FILENAME_PATTERN = re.compile(r"([^_]+)_([^_]+)_([^.]+)(.[a-z]*)")
 
     def __post_init__(self):
         if self.folder_path is None:
@@ -73,7 +73,7 @@ class PipsimModel:
 
         if self.case is None or self.condition is None:
             filename = str(Path(self.model_filename).stem + Path(self.model_filename).suffix)
-            match = re.match(self.FILENAME_PATTERN, filename)
+            match = self.FILENAME_PATTERN.match(filename)
             if match:
                 self.case = match.group(1)
                 self.condition = match.group(2)
@@ -12,19 +12,27 @@ This module contains the class for building the model for network simulation usi
     - PipsimModellingError: Raised when an error occurs in the modelling process.
 """
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import cached_property
+from hashlib import blake2b
 from itertools import product
 
 # import traceback
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 from sixgill.definitions import ModelComponents, Parameters
 from sixgill.pipesim import Model
 
 from app.core import ExcelInputError, PipsimModellingError
+from app.core.excel_handling import EXCEL_READ_ENGINE
 
 logger = logging.getLogger(__name__)
 
+# Each copy worker opens its own Pipesim model, which costs a licence and memory.
+DEFAULT_COPY_WORKERS = 2
+
 
 class ConditionColumns:
     """
@@ -63,6 +71,9 @@ class MultiCaseModeller:
     well_lists: list
 
     MINIMUM_FLOWRATE = 0.001  # Minimum flowrate for a well to be active (STBD)
+    # Part of the saved model signature; bump it whenever build_model changes what
+    # it writes into a case model, so models saved by older versions are rebuilt.
+    BUILDER_VERSION = 1
 
     def __init__(
         self,
@@ -73,37 +84,49 @@ class MultiCaseModeller:
     ) -> None:
         self.base_model_path = base_model_path
         self.excel_path = excel_path
-        self.sink_profile = self._fetch_excel_data(sink_profile_sheet, "Sinks")
-        self.conditions = self._fetch_excel_data(condition_sheet, "Conditions")
+        with pd.ExcelFile(excel_path, engine=EXCEL_READ_ENGINE) as excel_file:
+            self.sink_profile = self._fetch_excel_data(
+                excel_file, sink_profile_sheet, "Sinks"
+            )
+            self.conditions = self._fetch_excel_data(
+                excel_file, condition_sheet, "Conditions"
+            )
+        self._sinks_in_excel = frozenset(self.sink_profile.index)
+        self._pending_values: dict = {}
 
-    def _fetch_excel_data(self, sheet_name: str, key_column: str) -> pd.DataFrame:
+    def _fetch_excel_data(
+        self, excel_file: pd.ExcelFile, sheet_name: str, key_column: str
+    ) -> pd.DataFrame:
         """
         Fetches data from the specified excel sheet.
 
         Args:
+            excel_file (pd.ExcelFile): The open workbook, shared by all sheet reads.
             sheet_name (str): The name of the sheet to fetch data from.
             key_column (str): The key column to set as index and to look for header row.
 
         Returns:
             pd.DataFrame: The fetched data as a DataFrame.
         """
-        data = pd.read_excel(self.excel_path, sheet_name=sheet_name)
+        data = excel_file.parse(sheet_name=sheet_name)
 
-        if not key_column in data.iloc[:, 0].to_list():
+        key_mask = data.iloc[:, 0].to_numpy() == key_column
+        if not key_mask.any():
             msg = f"Key column '{key_column}' not found in the first column "
             raise ExcelInputError(msg, self.excel_path, sheet_name)
 
-        header_row = data.loc[data.iloc[:, 0] == key_column].index[0]
+        header_row = int(key_mask.argmax())
         data.columns = data.iloc[header_row]
         data = data.iloc[header_row + 1 :]
         data = data.dropna(subset=[key_column]).reset_index(drop=True)
         data = data.set_index(key_column) if key_column == "Sinks" else data
 
-        if any("_" in str(col) for col in data.columns):
+        columns = data.columns.astype(str)
+        if columns.str.contains("_", regex=False).any():
             logger.warning(
                 "Don't use underscores in column names.Replacing underscores with hyphens "
             )
-            data.columns = data.columns.str.replace("_", "-")
+            data.columns = columns.str.replace("_", "-", regex=False)
 
         if key_column == "Conditions":
             mandatory_cols = [
@@ -134,29 +157,20 @@ class MultiCaseModeller:
             self.conditions[ConditionColumns.CONDITIONS] == condition
         ]
         if df.empty:
-            logger.warning(f"No Simulation settings found for condition: {condition}")
+            logger.warning("No Simulation settings found for condition: %s", condition)
             return
 
-        for _, row in df.iterrows():
-            if (
-                row[ConditionColumns.COMPONENT_TYPE]
-                == Parameters.SimulationSetting.__name__
-            ):
-                print(_)
-                attr = self.model.sim_settings.__dict__.get("_settings").get(
-                    row[ConditionColumns.PARAMETER]
-                )
-                setattr(self.model.sim_settings, attr, row["Value"])
-
-        reset = self.model.tasks.networksimulation.reset_conditions() # type: ignore
-        self.model.save()
+        settings = df.loc[
+            df[ConditionColumns.COMPONENT_TYPE] == Parameters.SimulationSetting.__name__
+        ]
+        setting_names = self.model.sim_settings.__dict__.get("_settings")
+        for parameter, value in zip(
+            settings[ConditionColumns.PARAMETER], settings[ConditionColumns.VALUE]
+        ):
+            attr = setting_names.get(parameter)
+            setattr(self.model.sim_settings, attr, value)
 
-        if reset:
-            logger.info(f"Set simulation settings for condition: {condition}")
-        else:
-            logger.warning(
-                f"Failed to set simulation settings for condition: {condition}"
-            )
+        logger.info("Set simulation settings for condition: %s", condition)
 
     def set_parameters_dict(self, condition: str) -> None:
 
@@ -165,62 +179,140 @@ class MultiCaseModeller:
         ]
 
         if data.empty:
-            logger.warning(f"No parameters found for condition: {condition}")
+            logger.warning("No parameters found for condition: %s", condition)
             return
 
-        result = {}
-        for component_name, parameter, value in zip(
-            data[ConditionColumns.COMPONENT_NAME],
-            data[ConditionColumns.PARAMETER],
-            data[ConditionColumns.VALUE],
-        ):
-            if not pd.isnull(component_name) and not pd.isnull(parameter):
-                component_name = str(component_name).strip()
-                if component_name not in result:
-                    result[component_name] = {}
-                result[component_name][parameter] = value
+        data = data.dropna(
+            subset=[ConditionColumns.COMPONENT_NAME, ConditionColumns.PARAMETER]
+        )
+        component_names = data[ConditionColumns.COMPONENT_NAME].astype(str).str.strip()
+        result = {
+            component_name: dict(
+                zip(group[ConditionColumns.PARAMETER], group[ConditionColumns.VALUE])
+            )
+            for component_name, group in data.groupby(component_names, sort=False)
+        }
 
-        self.model.set_values(dict=result)
-        reset = self.model.tasks.networksimulation.reset_conditions()  # type: ignore
-
-        if reset:
-            logger.info(f"Set parameters for condition: {condition}")
-        else:
-            logger.warning(f"Failed to set parameters for condition: {condition}")
+        self._queue_values(result)
+        logger.info("Queued parameters for condition: %s", condition)
 
     def set_sink_data(self, case: str, parameter: str = Parameters.Sink.LIQUIDFLOWRATE):
 
         # Get the missing sinks
-        sinks_in_model = set(
-            self.model.get_values(component=ModelComponents.SINK).keys()
-        )
-        sinks_in_excel = set(self.sink_profile.index)
-
-        if (sinks_in_excel - sinks_in_model) or (sinks_in_model - sinks_in_excel):
-            raise PipsimModellingError("Sinks in model and excel do not match.")
+        sinks_in_model = self._sink_names
+        if sinks_in_model != self._sinks_in_excel:
+            missing_in_model = self._sinks_in_excel - sinks_in_model
+            missing_in_excel = sinks_in_model - self._sinks_in_excel
+            raise PipsimModellingError(
+                "Sinks in model and excel do not match. "
+                f"Not in model: {sorted(missing_in_model, key=str)}, "
+                f"not in excel: {sorted(missing_in_excel, key=str)}"
+            )
 
         # Transform sink profile to dictionary
-        sink_data = self.sink_profile.loc[:, [case]]
-        sink_data.columns = [parameter]
+        rates = self.sink_profile[case].to_numpy()
 
         # DeActivate sinks with minimum flowrate
-        sink_data[Parameters.ModelComponent.ISACTIVE] = (
-            sink_data[parameter] > self.MINIMUM_FLOWRATE
-        )
-        sink_data[Parameters.Sink.FLOWRATETYPE] = parameter
+        active = rates > self.MINIMUM_FLOWRATE
+
+        sink_data_dict = {
+            sink: {
+                parameter: rate,
+                Parameters.ModelComponent.ISACTIVE: is_active,
+                Parameters.Sink.FLOWRATETYPE: parameter,
+            }
+            for sink, rate, is_active in zip(
+                self.sink_profile.index.tolist(), rates.tolist(), active.tolist()
+            )
+        }
+
+        self._queue_values(sink_data_dict)
+
+        logger.info("Queued sink data for case: %s", case)
+
+    @cached_property
+    def _sink_names(self) -> frozenset:
+        """Names of the sinks in the open model, fetched once per opened model."""
+        return frozenset(self.model.get_values(component=ModelComponents.SINK).keys())
+
+    def _open_base_model(self) -> None:
+        self.model = Model.open(self.base_model_path)
+        self.__dict__.pop("_sink_names", None)
+
+    def _queue_values(self, values: dict) -> None:
+        """Merges component values into the batch sent by apply_pending_values."""
+        for component_name, parameters in values.items():
+            self._pending_values.setdefault(component_name, {}).update(parameters)
 
-        sink_data_dict = sink_data.to_dict("index")
+    def apply_pending_values(self) -> None:
+        """
+        Sends all queued component values to the model in a single set_values
+        call and resets the network simulation conditions once.
+        """
+        if self._pending_values:
+            self.model.set_values(dict=self._pending_values)
+            self._pending_values = {}
+        reset = self.model.tasks.networksimulation.reset_conditions()  # type: ignore
 
-        self.model.set_values(dict=sink_data_dict)
+        if reset:
+            logger.info("Applied queued values to the model")
+        else:
+            logger.warning("Failed to reset conditions after applying queued values")
+
+    def _model_signature(self, case: str, condition: str, sink_parameter: str) -> str:
+        """
+        Hashes everything a saved case model is built from: the builder version,
+        the base model file, the condition rows (parameters and simulation
+        settings) and the sink profile of the case.
+        """
+        base_stat = Path(self.base_model_path).stat()
+        condition_rows = self.conditions.loc[
+            self.conditions[ConditionColumns.CONDITIONS] == condition
+        ]
+        digest = blake2b(digest_size=16)
+        for part in (
+            self.BUILDER_VERSION,
+            self.MINIMUM_FLOWRATE,
+            case,
+            condition,
+            sink_parameter,
+            base_stat.st_mtime_ns,
+            base_stat.st_size,
+            condition_rows.to_csv(index=False),
+            self.sink_profile[case].to_csv(),
+        ):
+            digest.update(str(part).encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
 
-        logger.info(f"Set sink data for case: {case}")
+    def save_as_new_model(
+        self,
+        case: str,
+        condition: str,
+        sink_parameter: str = Parameters.Sink.LIQUIDFLOWRATE,
+    ) -> None:
+        """
+        Saves the model as a new file for the case and condition.
 
-    def save_as_new_model(self, case: str, condition: str) -> None:
+        A '.hash' file is kept next to the saved model. The save is skipped when
+        the model was already saved from the same inputs and not changed since.
+        """
         folder_path = Path(self.excel_path).parent.absolute() / "Models"
         folder_path.mkdir(exist_ok=True)
-        new_file = folder_path / f"{case}_{condition}_{Path(self.model.filename).name}"
+        base_name = Path(self.base_model_path).name
+        new_file = folder_path / f"{case}_{condition}_{base_name}"
+        hash_file = new_file.with_name(new_file.name + ".hash")
+        signature = self._model_signature(case, condition, sink_parameter)
+
+        if new_file.exists() and hash_file.exists():
+            saved = hash_file.read_text().split()
+            if saved == [signature, str(new_file.stat().st_mtime_ns)]:
+                logger.info("Model %s is up to date. Skipping save.", new_file)
+                return
+
         self.model.save(str(new_file))
-        logger.info(f"Model saved as {new_file}")
+        hash_file.write_text(f"{signature} {new_file.stat().st_mtime_ns}")
+        logger.info("Model saved as %s", new_file)
 
     def close_model(self):
         self.model.close()
@@ -237,105 +329,189 @@ class MultiCaseModeller:
             condition: Condition for the simulation model.
             sink_parameter: The sink parameter to be set from the sink profile excel sheet.
         """
-        logger.info(f"Building model for case: {case}, condition: {condition}\n")
-        self.model = Model.open(self.base_model_path)
+        logger.info("Building model for case: %s, condition: %s\n", case, condition)
+        self._open_base_model()
         self.set_simulation_settings(condition)
         self.set_parameters_dict(condition)
         self.set_sink_data(case, sink_parameter)
-        self.save_as_new_model(case, condition)
+        self.apply_pending_values()
+        self.save_as_new_model(case, condition, sink_parameter)
         self.close_model()
 
     def build_all_models(self, sink_parameter=Parameters.Sink.LIQUIDFLOWRATE) -> None:
         """
         Builds simulation models for all possible cases and conditions.
+
+        The base model is opened once per condition and every sink profile case
+        is saved from it, since the conditions are the same for those cases.
         """
         logger.info(
             "Building models for all possible cases and conditions....."
-            f"Total combinations: {len(self.cases)}"
+            "Total combinations: %d",
+            len(self.cases),
         )
-        for case, condition in self.cases:
-            self.build_model(case, condition, sink_parameter)
+        for condition in self.conditions[ConditionColumns.CONDITIONS].unique():
+            self._open_base_model()
+            try:
+                self.set_simulation_settings(condition)
+                self.set_parameters_dict(condition)
+                for case in self.sink_profile.columns:
+                    logger.info(
+                        "Building model for case: %s, condition: %s\n", case, condition
+                    )
+                    self.set_sink_data(case, sink_parameter)
+                    self.apply_pending_values()
+                    self.save_as_new_model(case, condition, sink_parameter)
+            finally:
+                self._pending_values = {}
+                self.close_model()
 
         logger.info("All models built successfully \n")
 
 
 # Other methods in the module------------------------------------------------------------
+def _get_flowline_geometry(source_model, flowline: str):
+    """Returns the geometry of a flowline, or None if it cannot be read."""
+    try:
+        return source_model.get_geometry(context=flowline)
+    except Exception as e:
+        logger.error("Error getting geometry for %s: %s", flowline, e)
+        # logger.error(traceback.format_exc())
+        return None
+
+
 def _collect_flowline_geometry(df, source_model) -> list:
     """
-    Helper function to collect flowline geometry from the source model
-    used in the copy_flowline_data function
+    Helper function to collect (flowline, geometry) pairs from the source model
+    used in the copy_flowline_data function.
     """
-    flowline_geometry = []
-    detailed_flowlines = df.loc[:, df.loc["DetailedModel"] == True].columns.to_list()
-    for flowline in detailed_flowlines:
-        try:
-            flowline_geometry.append(
-                {flowline: source_model.get_geometry(context=flowline)}
-            )
-        except Exception as e:
-            logger.error(f"Error getting geometry for {flowline}: {e}")
-            # logger.error(traceback.format_exc())
-    return flowline_geometry
+    detailed_mask = df.loc["DetailedModel"].to_numpy() == True
+    detailed_flowlines = df.columns[detailed_mask].to_list()
+    geometries = [
+        _get_flowline_geometry(source_model, flowline)
+        for flowline in detailed_flowlines
+    ]
+    return [
+        (flowline, geometry)
+        for flowline, geometry in zip(detailed_flowlines, geometries)
+        if geometry is not None
+    ]
+
+
+def _apply_to_target(
+    target_model_path: Path, source_values: dict, flowline_geometry: list
+) -> None:
+    """
+    Helper function to copy the flowline values and geometry to one target model.
+    Kept at module level so copy_flowline_data can run it in a worker process.
+    """
+    target_model = Model.open(str(target_model_path))
+    try:
+        target_model.set_values(source_values)
+
+        for name, geometry in flowline_geometry:
+            target_model.set_geometry(context=name, value=geometry)
+        target_model.save()
+    finally:
+        target_model.close()
 
 
-def copy_flowline_data(source_model_path: str, destination_folder_path: str) -> None:
+def copy_flowline_data(
+    source_model_path: str,
+    destination_folder_path: str,
+    max_workers: int = DEFAULT_COPY_WORKERS,
+) -> None:
     """
     Copy flowline data from the source model to all target models in the destination folder.
 
     Args:
         source_model_path (str): The path to the source model file.
         destination_folder_path (str): The path to the destination folder containing target model files.
+        max_workers (int): Number of target models updated in parallel, each in its
+            own process with its own open model. 1 updates them one by one in
+            this process.
     """
 
-    if not Path(source_model_path).exists():
+    source_path = Path(source_model_path)
+    destination_folder = Path(destination_folder_path)
+    if not source_path.exists():
         raise PipsimModellingError(f"Source model file not found: {source_model_path}")
-    if not Path(destination_folder_path).exists():
+    if not destination_folder.exists():
         raise PipsimModellingError(
             f"Destination folder not found: {destination_folder_path}"
         )
 
+    target_files = list(destination_folder.glob("*.pips"))
+    total_targets = len(target_files)
+
     logger.info(
-        f"Copying flowline data from {Path(source_model_path).name} "
-        f"to all models in {destination_folder_path}....."
+        "Copying flowline data from %s to all models in %s.....",
+        source_path.name,
+        destination_folder_path,
     )
     logger.info(
-        "Total number of flowlines in the destination folder: %d",
-        len(list(Path(destination_folder_path).glob("*.pips"))),
+        "Total number of flowlines in the destination folder: %d", total_targets
     )
 
     source_model = Model.open(source_model_path)
-    logger.info(f"Getting flowline data from {Path(source_model_path).name}.....")
+    logger.info("Getting flowline data from %s.....", source_path.name)
     source_values = source_model.get_values(component=ModelComponents.FLOWLINE)
     df = pd.DataFrame(source_values)
     flowline_geometry = _collect_flowline_geometry(df, source_model)
     source_model.close()
 
-    target_files = list(Path(destination_folder_path).glob("*.pips"))
-
-    for idx, target_model_path in enumerate(target_files, start=1):
-        logger.info(
-            f"Copying basic flowline data from to {Path(target_model_path).name}....."
-        )
-        logger.warning(
-            """This step may take a while depending on the number of flowlines in the model.
-            Please wait for the process to complete."""
-        )
-        target_model = Model.open(str(target_model_path))
-        target_model.set_values(source_values)
-        target_model.save()
-
-        logger.info(
-            f"Copying detailed flowline data to {Path(target_model_path).name}....."
+    logger.warning(
+        """This step may take a while depending on the number of flowlines in the model.
+        Please wait for the process to complete."""
+    )
+    failures = []
+
+    def log_outcome(idx: int, target_model_path: Path, error: Optional[str]) -> None:
+        if error is None:
+            logger.info(
+                "Flowline data copied successfully to %s (Completed %d of %d models)",
+                target_model_path.name,
+                idx,
+                total_targets,
+            )
+            return
+        failures.append((target_model_path.name, error))
+        logger.error(
+            "Failed to copy flowline data to %s: %s (Completed %d of %d models)",
+            target_model_path.name,
+            error,
+            idx,
+            total_targets,
         )
 
-        for flowline in flowline_geometry:
-            for name, geometry in flowline.items():
-                target_model.set_geometry(context=name, value=geometry)
-        target_model.save()
-        target_model.close()
-        logger.info(
-            "Flowline data copied successfully to %s (Completed %d of %d models)",
-            Path(target_model_path).name,
-            idx,
-            len(target_files),
+    if max_workers <= 1:
+        for idx, target_model_path in enumerate(target_files, start=1):
+            try:
+                _apply_to_target(target_model_path, source_values, flowline_geometry)
+                log_outcome(idx, target_model_path, None)
+            except Exception as e:
+                log_outcome(idx, target_model_path, str(e))
+    else:
+        workers = min(max_workers, total_targets) or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _apply_to_target,
+                    target_model_path,
+                    source_values,
+                    flowline_geometry,
+                ): target_model_path
+                for target_model_path in target_files
+            }
+            for idx, future in enumerate(as_completed(futures), start=1):
+                try:
+                    future.result()
+                    log_outcome(idx, futures[future], None)
+                except Exception as e:
+                    log_outcome(idx, futures[future], str(e))
+
+    if failures:
+        raise PipsimModellingError(
+            f"Failed to copy flowline data to {len(failures)} of {total_targets} "
+            "models:\n" + "\n".join(f"  {name}: {error}" for name, error in failures)
         )
@@ -5,9 +5,11 @@ using the Pipesim model.
 """
 
 import logging
+import threading
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import ClassVar, Dict, List, NamedTuple, Optional
 
 import pandas as pd
 from sixgill.definitions import ProfileVariables, SystemVariables
@@ -18,6 +20,19 @@ from app.core.excel_handling import ExcelHandler, ExcelHandlerError
 
 logger = logging.getLogger(__name__)
 
+_simulation_pool: Optional[ProcessPoolExecutor] = None
+_simulation_pool_workers = 0
+_simulation_pool_lock = threading.Lock()
+
+
+class SimulationResults(NamedTuple):
+    """Processed results of one model, kept in memory for the summary step."""
+
+    node_units: pd.DataFrame
+    node_results: pd.DataFrame
+    profile_units: pd.DataFrame
+    profile_results: pd.DataFrame
+
 
 class NetworkSimulator:
     """
@@ -28,11 +43,15 @@ class NetworkSimulator:
         system_variables (list): List of system variables to retrieve.
         profile_variables (list): List of profile variables to retrieve.
         node_results (Optional[pd.DataFrame]): DataFrame containing node simulation results.
+        node_units (Optional[pd.DataFrame]): Single row with the units of the node results.
         profile_results (Optional[pd.DataFrame]): DataFrame containing profile simulation results.
+        profile_units (Optional[pd.DataFrame]): Single row with the units of the profile results.
     """
 
     NODE_RESULTS_FILE: str = "Node Results.xlsx"
     PROFILE_RESULTS_FILE: str = "Profile Results.xlsx"
+    # Results kept on request for the summary, keyed by results folder, then sheet.
+    _results_store: ClassVar[Dict[str, Dict[str, SimulationResults]]] = {}
 
     def __init__(
         self,
@@ -59,7 +78,12 @@ class NetworkSimulator:
         ]
         self.unit = unit
         self.node_results: Optional[pd.DataFrame] = None
+        self.node_units: Optional[pd.DataFrame] = None
         self.profile_results: Optional[pd.DataFrame] = None
+        self.profile_units: Optional[pd.DataFrame] = None
+        self._conditions: Optional[dict] = None
+        self._conditions_df: Optional[pd.DataFrame] = None
+        self._conditions_dirty = True
         self.folder = folder
 
     def run_simulation(self) -> None:
@@ -70,6 +94,7 @@ class NetworkSimulator:
             )
 
         self.model.tasks.networksimulation.reset_conditions()  # type: ignore
+        self._conditions_dirty = True
         self.results = self.model.tasks.networksimulation.run(  # type: ignore
             system_variables=self.system_variables,
             profile_variables=self.profile_variables,
@@ -93,28 +118,31 @@ class NetworkSimulator:
         self.node_results.reset_index(inplace=True)
         self.node_results.rename(columns={"index": "Node"}, inplace=True)
 
-        self.node_results[SystemVariables.TYPE] = self.node_results["Node"].apply(
-            lambda well: (
-                self.boundary_conditions.loc["BoundaryNodeType", well]
-                if well in self.boundary_conditions.columns
-                else None
-            )
-        )
-
-        unit_row = self.node_results.iloc[:1]
-        self.node_results = self.node_results.iloc[1:]
-        self.node_results.sort_values(
-            by=[SystemVariables.TYPE, "Node"], ascending=[False, True], inplace=True
+        # Conditions fetched before the run are kept: reset_conditions changes them.
+        if self._conditions is None:
+            self.get_boundary_conditions()
+        node_types = {
+            node: conditions["BoundaryNodeType"]
+            for node, conditions in self._conditions.items()
+            if "BoundaryNodeType" in conditions
+        }
+        self.node_results[SystemVariables.TYPE] = (
+            self.node_results["Node"].map(node_types).astype("category")
         )
-        # self.node_results.dropna(subset=[SystemVariables.TYPE], inplace=True)
-        self.node_results = pd.concat([unit_row, self.node_results], ignore_index=True)
 
         cols = ["Node"] + [
             col
             for col in self.node_results.columns
             if col not in ["Node", SystemVariables.TYPE]
         ]
-        self.node_results = self.node_results[cols]
+        self.node_units = self.node_results.iloc[:1][cols].reset_index(drop=True)
+        self.node_results = self.node_results.iloc[1:].infer_objects()
+        self.node_results.sort_values(
+            by=[SystemVariables.TYPE, "Node"], ascending=[False, True], inplace=True
+        )
+        # self.node_results.dropna(subset=[SystemVariables.TYPE], inplace=True)
+        self.node_results = self.node_results[cols].reset_index(drop=True)
+        self.node_results.index += 1
 
         logger.info("Node results processed successfully.")
 
@@ -125,66 +153,143 @@ class NetworkSimulator:
                 "Simulation results not available.", self.model_path
             )
 
-        units = pd.DataFrame(self.results.profile_units, index=["Units"])
-        dfs = []
-
-        for branch, branch_data in sorted(self.results.profile.items()):
-            try:
-                branch_df = pd.DataFrame.from_dict(branch_data)
-                branch_df["BranchEquipment"] = branch_df["BranchEquipment"].ffill()
-                unique_rows = branch_df.drop_duplicates(
-                    subset=["BranchEquipment"], keep="last"
-                )
-                unique_rows.insert(0, "Branch", branch)
-                dfs.append(unique_rows)
-            except Exception as e:
-                logger.error(f"Error processing branch {branch}: {e}")
-
-        combined_df = pd.concat(dfs, ignore_index=True)
+        combined_df = pd.concat(
+            {
+                branch: pd.DataFrame.from_dict(branch_data)
+                for branch, branch_data in self.results.profile.items()
+            },
+            names=["Branch"],
+        ).reset_index(level=0)
+        combined_df["BranchEquipment"] = combined_df.groupby("Branch", sort=False)[
+            "BranchEquipment"
+        ].ffill()
+        combined_df = combined_df.drop_duplicates(
+            subset=["Branch", "BranchEquipment"], keep="last"
+        )
         combined_df.sort_values(by=["Branch", "BranchEquipment"], inplace=True)
-        self.profile_results = pd.concat([units, combined_df], ignore_index=True)
 
         cols = ["Branch", "BranchEquipment"] + [
             col
-            for col in self.profile_results.columns
+            for col in combined_df.columns
             if col not in ["Branch", "BranchEquipment"]
         ]
-        self.profile_results = self.profile_results[cols]
+        self.profile_results = combined_df[cols].reset_index(drop=True)
+        self.profile_results.index += 1
+        self.profile_units = pd.DataFrame(self.results.profile_units, index=[0])
         logger.info("Profile results processed successfully.")
 
-    def write_results_to_excel(self) -> None:
-        """Writes simulation results to Excel files."""
+    def write_results_to_excel(self, keep_results: bool = False) -> None:
+        """
+        Writes simulation results to Excel files.
+
+        Args:
+            keep_results (bool): Also keep the results in memory for get_results.
+        """
         if self.node_results is None or self.profile_results is None:
             raise NetworkSimulationError(
                 "Results are not available to write to Excel.", self.model_path
             )
 
-        sheet_name = Path(self.model_path).stem[:31]
+        self.write_results(
+            self.model_path,
+            self.folder,
+            SimulationResults(
+                self.node_units,
+                self.node_results,
+                self.profile_units,
+                self.profile_results,
+            ),
+            keep_results,
+        )
 
-        ExcelHandler.write_excel(
-            df=self.node_results,
-            sheet_name=sheet_name,
-            clear_sheet=True,
+    @classmethod
+    def write_results(
+        cls,
+        model_path: str,
+        folder: str,
+        results: SimulationResults,
+        keep_results: bool = False,
+    ) -> None:
+        """
+        Writes the results of one model to the node and profile workbooks.
+
+        Args:
+            model_path (str): Path of the simulated model; its name is the sheet name.
+            folder (str): Folder containing the results workbooks.
+            results (SimulationResults): The processed results of the model.
+            keep_results (bool): Also keep the results in memory for get_results.
+                Off by default, as every model's frames would stay in memory.
+        """
+        sheet_name = Path(model_path).stem[:30]
+        folder_path = Path(folder).absolute()
+
+        ExcelHandler.write_sheets(
+            str(folder_path / cls.NODE_RESULTS_FILE),
+            {sheet_name: results.node_results},
             sht_range="A2",
-            workbook=str(Path(self.folder).absolute() / self.NODE_RESULTS_FILE),
+            clear_sheet=True,
+            units={sheet_name: results.node_units},
         )
-
-        ExcelHandler.write_excel(
-            df=self.profile_results,
-            sheet_name=sheet_name,
+        ExcelHandler.write_sheets(
+            str(folder_path / cls.PROFILE_RESULTS_FILE),
+            {sheet_name: results.profile_results},
+            sht_range="A2",
             clear_sheet=True,
-            workbook=str(Path(self.folder).absolute() / self.PROFILE_RESULTS_FILE),
+            units={sheet_name: results.profile_units},
         )
 
+        if keep_results:
+            cls._results_store.setdefault(str(folder_path), {})[sheet_name] = results
         logger.info("Results written to Excel successfully.")
 
+    @classmethod
+    def clear_results(cls, folder: str) -> None:
+        """
+        Forgets the in-memory results of a results folder. Call it at the start
+        of a run so results of earlier runs are not mixed into the new one.
+
+        Args:
+            folder (str): Folder containing the results workbooks.
+        """
+        cls._results_store.pop(str(Path(folder).absolute()), None)
+
+    @classmethod
+    def get_results(cls, folder: str) -> Dict[str, SimulationResults]:
+        """
+        Returns the results written with keep_results to the workbooks of a folder in
+        the current run, keyed by sheet name. Pass them to NetworkSimulationSummary
+        to skip reading the workbooks back, then call clear_results to free them.
+
+        Args:
+            folder (str): Folder containing the results workbooks.
+
+        Returns:
+            Dict[str, SimulationResults]: The results of the run, by sheet name.
+        """
+        return dict(cls._results_store.get(str(Path(folder).absolute()), {}))
+
     def get_boundary_conditions(self) -> None:
-        """Retrieves boundary conditions from the Pipesim model."""
-        self.boundary_conditions = pd.DataFrame.from_dict(
-            self.model.tasks.networksimulation.get_conditions()  # type: ignore
-        )
+        """
+        Retrieves boundary conditions from the Pipesim model.
+        Does nothing if the conditions have not changed since the last fetch.
+        """
+        if not self._conditions_dirty:
+            return
+        networksimulation = self.model.tasks.networksimulation  # type: ignore
+        self._conditions = networksimulation.get_conditions()
+        self._conditions_df = None
+        self._conditions_dirty = False
         logger.info("Boundary conditions retrieved successfully.")
 
+    @property
+    def boundary_conditions(self) -> Optional[pd.DataFrame]:
+        """Boundary conditions as a DataFrame, built from the fetched dict on request."""
+        if self._conditions is None:
+            return None
+        if self._conditions_df is None:
+            self._conditions_df = pd.DataFrame.from_dict(self._conditions)
+        return self._conditions_df
+
     def close_model(self) -> None:
         """Closes the Pipesim model to release resources."""
         self.model.close()
@@ -208,3 +313,94 @@ class NetworkSimulator:
             print(traceback.format_exc())
         finally:
             self.close_model()
+
+
+def simulate_model(
+    model_path: str,
+    system_variables: Optional[List[str]] = None,
+    profile_variables: Optional[List[str]] = None,
+    unit: str = Units.METRIC,
+    folder: str = "",
+) -> SimulationResults:
+    """
+    Runs one model and returns its processed results without writing them to Excel.
+    Meant for worker processes: the caller writes the results with
+    NetworkSimulator.write_results, so only one process touches the workbooks.
+
+    Args:
+        model_path (str): Path to the Pipesim model file.
+        system_variables (Optional[List[str]]): System variables to retrieve.
+        profile_variables (Optional[List[str]]): Profile variables to retrieve.
+        unit (str): Unit system of the results.
+        folder (str): Folder of the results workbooks.
+
+    Returns:
+        SimulationResults: The processed node and profile results.
+
+    Raises:
+        NetworkSimulationError: If the simulation or processing fails.
+    """
+    try:
+        ns = NetworkSimulator(
+            model_path, system_variables, profile_variables, unit, folder
+        )
+    except Exception as e:
+        raise NetworkSimulationError(f"Failed to open model: {e}", model_path) from None
+    try:
+        ns.get_boundary_conditions()
+        ns.run_simulation()
+        ns.process_node_results()
+        ns.process_profile_results()
+        ns.model.save()
+        return SimulationResults(
+            ns.node_units, ns.node_results, ns.profile_units, ns.profile_results
+        )
+    except NetworkSimulationError:
+        raise
+    except Exception as e:
+        # Re-raised as a picklable error so it reaches the parent process.
+        raise NetworkSimulationError(
+            f"An error occurred during simulation: {e}", model_path
+        ) from None
+    finally:
+        ns.close_model()
+
+
+def _init_simulation_worker() -> None:
+    """Runs once per worker process; pandas and sixgill are loaded with this module."""
+    logging.basicConfig(level=logging.INFO)
+
+
+def get_simulation_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the shared pool of simulation worker processes.
+
+    The workers stay alive between runs so each one pays the process start-up and
+    the pandas/sixgill imports once per session. The pool is replaced only when a
+    different number of workers is requested.
+
+    Args:
+        max_workers (int): Number of worker processes.
+
+    Returns:
+        ProcessPoolExecutor: The pool to submit simulate_model calls to.
+    """
+    global _simulation_pool, _simulation_pool_workers
+    with _simulation_pool_lock:
+        if _simulation_pool is None or _simulation_pool_workers != max_workers:
+            if _simulation_pool is not None:
+                _simulation_pool.shutdown(wait=False)
+            _simulation_pool = ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_simulation_worker
+            )
+            _simulation_pool_workers = max_workers
+        return _simulation_pool
+
+
+def shutdown_simulation_pool() -> None:
+    """Stops the simulation workers, dropping any simulations not yet started."""
+    global _simulation_pool
+    with _simulation_pool_lock:
+        if _simulation_pool is not None:
+            _simulation_pool.shutdown(wait=True, cancel_futures=True)
+            _simulation_pool = None
@@ -2,18 +2,27 @@
 
 import logging
 from pathlib import Path
+from typing import Dict, Literal, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import xlwings as xw
 from sixgill.definitions import ProfileVariables
 
 from app.core import ExcelHandler, NetworkSimulator
+from app.core.excel_handling import EXCEL_READ_ENGINE
+from app.core.network_simulation import SimulationResults
 
 parameters = [
     ProfileVariables.MEAN_VELOCITY_FLUID,
     ProfileVariables.PRESSURE,
 ]
+SUMMARY_SHEETS = frozenset(parameters + ["Pump Operating Points"])
+PUMP_COLUMNS = frozenset(
+    ["BranchEquipment", "Pressure", ProfileVariables.VOLUME_FLOWRATE_WATER_INSITU]
+)
+# Identifier columns read as text; value columns share the sheet with the units row.
+NODE_DTYPES = {"Node": str}
+PROFILE_DTYPES = {"Branch": str, "BranchEquipment": str}
 
 
 class SummaryError(Exception):
@@ -24,11 +33,35 @@ class SummaryWarning(Exception):
     """Base class for exceptions in this module."""
 
 
+def _min_max_positions(values: np.ndarray, mask: Optional[np.ndarray] = None):
+    """
+    Returns the positions of the minimum and maximum values, ignoring NaNs and,
+    if given, the positions where mask is False.
+    """
+    candidates = np.flatnonzero(mask) if mask is not None else np.arange(len(values))
+    candidates = candidates[~np.isnan(values[candidates])]
+    if candidates.size == 0:
+        raise SummaryWarning("No numeric values to get the minimum and maximum from.")
+    selected = values[candidates]
+    return int(candidates[selected.argmin()]), int(candidates[selected.argmax()])
+
+
+def _get_operation(cases: pd.Series) -> pd.Categorical:
+    """Labels each case as early or late operation from its "-EO" suffix."""
+    return pd.Categorical(
+        np.where(cases.str.contains("-EO"), "Early Operation", "Late Operation"),
+        categories=["Early Operation", "Late Operation"],
+    )
+
+
 class NetworkSimulationSummary:
     """
     Class to get summary of the network simulation results produced
     by the 'NetworkSimulation' class.
 
+    The results are read from the Excel files unless they are passed in as
+    'results', e.g. from NetworkSimulator.get_results(folder) after a run
+    that wrote them with keep_results=True.
     """
 
     node_summary: pd.DataFrame
@@ -40,6 +73,7 @@ class NetworkSimulationSummary:
         self,
         node_result_xl: str = NetworkSimulator.NODE_RESULTS_FILE,
         profile_result_xl: str = NetworkSimulator.PROFILE_RESULTS_FILE,
+        results: Optional[Dict[str, SimulationResults]] = None,
     ) -> None:
         self.logger = logging.getLogger(__name__)
 
@@ -50,6 +84,35 @@ class NetworkSimulationSummary:
 
         self.node_result_xl = node_result_xl
         self.profile_result_xl = profile_result_xl
+        self.results = results
+
+    def _get_sheet_names(self, workbook: str) -> list:
+        if self.results is not None:
+            return list(self.results)
+        return ExcelHandler.get_sheet_names(workbook)
+
+    def _get_results_sheet(
+        self, kind: Literal["node", "profile"], sheet_name: str
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Returns the units row and the data of a results sheet, from the in-memory
+        results when available and from the Excel file otherwise.
+        """
+        if self.results is not None:
+            result = self.results[sheet_name]
+            if kind == "node":
+                return result.node_units, result.node_results.copy()
+            return result.profile_units, result.profile_results.copy()
+
+        df = pd.read_excel(
+            self.node_result_xl if kind == "node" else self.profile_result_xl,
+            sheet_name=sheet_name,
+            header=1,
+            index_col=0,
+            dtype=NODE_DTYPES if kind == "node" else PROFILE_DTYPES,
+            engine=EXCEL_READ_ENGINE,
+        )
+        return df.iloc[:1], df.iloc[1:].copy()
 
     @staticmethod
     def get_min_max_parameter(
@@ -57,25 +120,16 @@ class NetworkSimulationSummary:
     ):
         if parameter not in df.columns:
             raise SummaryWarning(f"Parameter '{parameter}' not in the dataframe.")
-        df = df.copy()
-        df[parameter] = pd.to_numeric(df[parameter], errors="coerce")
-        if "Type" in df.columns:
-            min_parameter_idx = df.loc[df["Type"] == "Sink", parameter].idxmin()
-            max_parameter_idx = df.loc[df["Type"] == "Sink", parameter].idxmax()
-        else:
-            min_parameter_idx = df[parameter].idxmin()
-            max_parameter_idx = df[parameter].idxmax()
-        df.loc[min_parameter_idx, "Min/Max"] = "Minimum"
-        df.loc[max_parameter_idx, "Min/Max"] = "Maximum"
-
-        df["Case"] = case
-
-        max_min_results = pd.concat(
-            [df.loc[[min_parameter_idx]], df.loc[[max_parameter_idx]]]
+        values = pd.to_numeric(df[parameter], errors="coerce").to_numpy(dtype=float)
+        sink_mask = (
+            (df["Type"] == "Sink").to_numpy(dtype=bool) if "Type" in df.columns else None
         )
-        max_min_results = max_min_results[
-            [equipment_column, parameter, "Min/Max", "Case"]
-        ]
+        min_pos, max_pos = _min_max_positions(values, sink_mask)
+
+        max_min_results = df.iloc[[min_pos, max_pos]][[equipment_column]].copy()
+        max_min_results[parameter] = values[[min_pos, max_pos]]
+        max_min_results["Min/Max"] = pd.Categorical(["Minimum", "Maximum"])
+        max_min_results["Case"] = case
 
         return max_min_results
 
@@ -83,20 +137,12 @@ class NetworkSimulationSummary:
     def add_min_max_remarks(df: pd.DataFrame, parameter: str) -> pd.DataFrame:
         if parameter not in df.columns:
             raise SummaryWarning(f"Parameter '{parameter}' not in the {df.columns}.")
-        df_copy = df.copy()
-        df_copy[parameter] = pd.to_numeric(df_copy[parameter], errors="coerce")
-
-        if "Type" in df_copy.columns:
-            min_parameter_idx = df_copy.loc[
-                df_copy["Type"] == "Sink", parameter
-            ].idxmin()
-            max_parameter_idx = df_copy.loc[
-                df_copy["Type"] == "Sink", parameter
-            ].idxmax()
-
-        else:
-            min_parameter_idx = df_copy[parameter].idxmin()
-            max_parameter_idx = df_copy[parameter].idxmax()
+        values = pd.to_numeric(df[parameter], errors="coerce").to_numpy(dtype=float)
+        sink_mask = (
+            (df["Type"] == "Sink").to_numpy(dtype=bool) if "Type" in df.columns else None
+        )
+        min_pos, max_pos = _min_max_positions(values, sink_mask)
+        min_parameter_idx, max_parameter_idx = df.index[min_pos], df.index[max_pos]
 
         df.loc[min_parameter_idx, "Remarks"] = f"Minimum {parameter}"
         df.loc[max_parameter_idx, "Remarks"] = f"Maximum {parameter}"
@@ -106,37 +152,13 @@ class NetworkSimulationSummary:
     def get_pump_operating_point(
         df: pd.DataFrame, case: str, suction_node: str, discharge_node: str
     ):
+        equipment = df.drop_duplicates(subset="BranchEquipment").set_index(
+            "BranchEquipment"
+        )
         try:
-            pump_op_df = pd.DataFrame(
-                data=np.nan,
-                columns=[
-                    "Case",
-                    "Suction Pressure",
-                    "Discharge Pressure",
-                    "Pump Head",
-                    "Pump Flow",
-                ],
-                index=[0],
-            )
-            pump_op_df["Case"] = case
-
-            pump_op_df["Suction Pressure"] = df.loc[
-                df["BranchEquipment"] == suction_node, "Pressure"
-            ].values[0]
-
-            pump_op_df["Discharge Pressure"] = df.loc[
-                df["BranchEquipment"] == discharge_node, "Pressure"
-            ].values[0]
-
-            pump_op_df["Pump Head"] = (
-                pump_op_df["Discharge Pressure"] - pump_op_df["Suction Pressure"]
-            )
-            pump_op_df["Pump Flow"] = df.loc[
-                df["BranchEquipment"] == discharge_node,
-                ProfileVariables.VOLUME_FLOWRATE_WATER_INSITU,
-            ].values[0]
-
-        except IndexError as exc:
+            suction = equipment.loc[suction_node]
+            discharge = equipment.loc[discharge_node]
+        except KeyError as exc:
             err_msg = (
                 f"Error in getting pump operating points '{suction_node}' and '{discharge_node}' "
                 f"in {case}.\n"
@@ -145,51 +167,64 @@ class NetworkSimulationSummary:
             )
             raise IndexError(err_msg) from exc
 
+        pump_op_df = pd.DataFrame(
+            {
+                "Case": [case],
+                "Suction Pressure": [suction["Pressure"]],
+                "Discharge Pressure": [discharge["Pressure"]],
+                "Pump Head": [discharge["Pressure"] - suction["Pressure"]],
+                "Pump Flow": [
+                    discharge[ProfileVariables.VOLUME_FLOWRATE_WATER_INSITU]
+                ],
+            }
+        )
+
         return pump_op_df
 
     def get_node_summary(self):
         self.logger.info("Getting Node Summary.....")
-        with xw.App(visible=False):
-            node_wb = xw.Book(self.node_result_xl)
-            node_sheets = [
-                sheet.name for sheet in node_wb.sheets if sheet.name != "Node Summary"
-            ]
-
-            node_summary_list = []
-            for sht in node_sheets:
-                try:
-                    node_df = pd.read_excel(
-                        self.node_result_xl, sheet_name=sht, header=1, index_col=0
-                    )
-                    # write back to excel
-                    node_df = NetworkSimulationSummary.add_min_max_remarks(
-                        df=node_df,
-                        parameter=ProfileVariables.PRESSURE,
-                    )
+        node_sheets = [
+            sheet
+            for sheet in self._get_sheet_names(self.node_result_xl)
+            if sheet != "Node Summary"
+        ]
 
-                    ws = node_wb.sheets(sht)
-                    ws.range("A1").value = sht
-                    ws.range("A2").value = node_df
-                    node_wb.save()
+        node_summary_list = []
+        remarked_sheets = {}
+        sheet_units = {}
+        for sht in node_sheets:
+            try:
+                sheet_units[sht], node_df = self._get_results_sheet("node", sht)
+                # write back to excel
+                node_df = NetworkSimulationSummary.add_min_max_remarks(
+                    df=node_df,
+                    parameter=ProfileVariables.PRESSURE,
+                )
+                remarked_sheets[sht] = node_df
 
-                    node_df = NetworkSimulationSummary.get_min_max_parameter(
-                        df=node_df,
-                        case=sht,
-                        parameter=ProfileVariables.PRESSURE,
-                        equipment_column="Node",
-                    )
-                    node_summary_list.append(node_df)
-                except SummaryWarning as exc:
-                    err = f"Error in getting node summary for {sht}: {exc}"
-                    self.logger.warning(err)
+                node_df = NetworkSimulationSummary.get_min_max_parameter(
+                    df=node_df,
+                    case=sht,
+                    parameter=ProfileVariables.PRESSURE,
+                    equipment_column="Node",
+                )
+                node_summary_list.append(node_df)
+            except SummaryWarning as exc:
+                err = f"Error in getting node summary for {sht}: {exc}"
+                self.logger.warning(err)
+
+        ExcelHandler.write_sheets(
+            self.node_result_xl,
+            remarked_sheets,
+            sht_range="A2",
+            write_sheet_name=True,
+            units=sheet_units,
+        )
 
         node_summary = pd.concat(node_summary_list, ignore_index=True)
         self.node_summary = node_summary
-        self.node_summary["Operation"] = np.where(
-            self.node_summary["Case"].str.contains("-EO"),
-            "Early Operation",
-            "Late Operation",
-        )
+        self.node_summary["Operation"] = _get_operation(self.node_summary["Case"])
+        self.node_summary["Case"] = self.node_summary["Case"].astype("category")
         self.node_summary.sort_values(
             by=["Operation", ProfileVariables.PRESSURE], inplace=True
         )
@@ -197,63 +232,76 @@ class NetworkSimulationSummary:
 
     def get_profile_summary(self):
         self.logger.info("Getting Profile Summary.....")
-        with xw.App(visible=False):
-            profile_wb = xw.Book(self.profile_result_xl)
-            self.profile_sheets = [
-                sheet.name
-                for sheet in profile_wb.sheets
-                if sheet.name not in parameters + ["Pump Operating Points"]
-            ]
-            self.profile_summary_list = {}
-            for parameter in parameters:
-                try:
-                    profile_summaries = []
-                    for sht in self.profile_sheets:
-                        try:
-                            profile_dff = pd.read_excel(
-                                self.profile_result_xl,
-                                sheet_name=sht,
-                                header=1,
-                                index_col=0,
-                            )
-                            profile_df = NetworkSimulationSummary.add_min_max_remarks(
-                                df=profile_dff, parameter=parameter
+        self.profile_sheets = [
+            sheet
+            for sheet in self._get_sheet_names(self.profile_result_xl)
+            if sheet not in SUMMARY_SHEETS
+        ]
+        self.profile_summary_list = {}
+        profile_dfs = {}
+        sheet_units = {}
+        remarked_sheets = {}
+        for parameter in parameters:
+            try:
+                profile_summaries = []
+                for sht in self.profile_sheets:
+                    try:
+                        if sht not in profile_dfs:
+                            sheet_units[sht], profile_dfs[sht] = (
+                                self._get_results_sheet("profile", sht)
                             )
-                            ws = profile_wb.sheets(sht)
-                            ws.range("A1").value = sht
-                            ws.range("A2").value = profile_df
-                            profile_wb.save()
-                            profile_df = NetworkSimulationSummary.get_min_max_parameter(
-                                df=profile_df,
-                                case=sht,
-                                parameter=parameter,
-                                equipment_column="BranchEquipment",
+                        profile_df = NetworkSimulationSummary.add_min_max_remarks(
+                            df=profile_dfs[sht], parameter=parameter
+                        )
+                        remarked_sheets[sht] = profile_df
+                        profile_df = NetworkSimulationSummary.get_min_max_parameter(
+                            df=profile_df,
+                            case=sht,
+                            parameter=parameter,
+                            equipment_column="BranchEquipment",
+                        )
+                        profile_summaries.append(profile_df)
+                    except SummaryWarning:
+                        if not sht in parameters:
+                            error_msg = (
+                                "Error in getting profile summary for parameter:\n"
+                                f"{parameter} in {sht}"
                             )
-                            profile_summaries.append(profile_df)
-                        except SummaryWarning:
-                            if not sht in parameters:
-                                error_msg = (
-                                    "Error in getting profile summary for parameter:\n"
-                                    f"{parameter} in {sht}"
-                                )
-                                logging.warning(error_msg)
-
-                    summary_df = pd.concat(profile_summaries, ignore_index=True)
-
-                    self.profile_summary_list[parameter] = summary_df
-
-                except Exception as e:
-                    logging.error(
-                        f"Error in getting profile summary for {parameter}: {e}"
-                    )
-                    raise e
+                            logging.warning(error_msg)
+
+                summary_df = pd.concat(profile_summaries, ignore_index=True)
+                summary_df["Case"] = summary_df["Case"].astype("category")
+
+                self.profile_summary_list[parameter] = summary_df
+
+            except Exception as e:
+                logging.error(f"Error in getting profile summary for {parameter}: {e}")
+                raise e
+
+        ExcelHandler.write_sheets(
+            self.profile_result_xl,
+            remarked_sheets,
+            sht_range="A2",
+            write_sheet_name=True,
+            units=sheet_units,
+        )
 
     def get_pump_operating_points(self, suction_node, discharge_node):
         self.logger.info("Getting Pump Operating Points.....")
         pump_operating_points_dfs = []
         for sht in self.profile_sheets:
             try:
-                df = pd.read_excel(self.profile_result_xl, sheet_name=sht, header=1)
+                if self.results is not None:
+                    df = self.results[sht].profile_results
+                else:
+                    df = pd.read_excel(
+                        self.profile_result_xl,
+                        sheet_name=sht,
+                        header=1,
+                        usecols=lambda col: col in PUMP_COLUMNS,
+                        dtype=PROFILE_DTYPES,
+                        engine=EXCEL_READ_ENGINE,
+                    )
                 pump_op_df = NetworkSimulationSummary.get_pump_operating_point(
                     df, sht, suction_node, discharge_node
                 )
@@ -263,20 +311,20 @@ class NetworkSimulationSummary:
         self.pump_operating_points = pd.concat(
             pump_operating_points_dfs, ignore_index=True
         )
-        self.pump_operating_points["Operation"] = np.where(
-            self.pump_operating_points["Case"].str.contains("-EO"),
-            "Early Operation",
-            "Late Operation",
+        self.pump_operating_points["Operation"] = _get_operation(
+            self.pump_operating_points["Case"]
         )
+        self.pump_operating_points["Case"] = self.pump_operating_points[
+            "Case"
+        ].astype("category")
         self.pump_operating_points.sort_values(by=["Operation", "Case"], inplace=True)
         self.pump_operating_points.reset_index(drop=True, inplace=True)
 
     def write_node_summary(self):
         self.logger.info("Writing Node Summary.....")
-        ExcelHandler.write_excel(
-            self.node_summary,
+        ExcelHandler.write_sheets(
             self.node_result_xl,
-            "Node Summary",
+            {"Node Summary": self.node_summary},
             sht_range="A2",
             clear_sheet=True,
         )
@@ -286,20 +334,18 @@ class NetworkSimulationSummary:
         for parameter, df in self.profile_summary_list.items():
             df.sort_values(by=[parameter], inplace=True)
             df.reset_index(drop=True, inplace=True)
-            ExcelHandler.write_excel(
-                df,
-                self.profile_result_xl,
-                sheet_name=parameter,
-                sht_range="A2",
-                clear_sheet=True,
-            )
+        ExcelHandler.write_sheets(
+            self.profile_result_xl,
+            self.profile_summary_list,
+            sht_range="A2",
+            clear_sheet=True,
+        )
 
     def write_pump_operating_points(self):
         self.logger.info("Writing Pump Operating Points.....")
-        ExcelHandler.write_excel(
-            self.pump_operating_points,
+        ExcelHandler.write_sheets(
             self.profile_result_xl,
-            sheet_name="Pump Operating Points",
+            {"Pump Operating Points": self.pump_operating_points},
             sht_range="A2",
             clear_sheet=True,
         )
@@ -4,6 +4,7 @@ unit conversion mappings are defined in the unit_conversions dictionary.
 unit nomenclature is based on the PIPSIM Units.
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -22,6 +23,17 @@ class UnitConversion:
         ("lbm/s", "kg/s"): lambda x: x * 0.453592,
     }
 
+    @staticmethod
+    def _to_float_array(series: pd.Series) -> np.ndarray:
+        """
+        Returns the series as a float array. Empty cells become NaN, but any other
+        non-numeric value raises, as the element-wise conversion did.
+        """
+        try:
+            return pd.to_numeric(series, errors="raise").to_numpy(dtype=float)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Non-numeric value in column '{series.name}': {e}") from e
+
     @staticmethod
     def convert_units(
         dataframe, conversions: dict, first_row_is_unit=True
@@ -49,13 +61,16 @@ class UnitConversion:
                     (source_unit, target_unit)
                 ]
                 if first_row_is_unit:
-                    # Apply conversion
-                    dataframe.loc[dataframe.index[1:], column] = dataframe.loc[
-                        dataframe.index[1:], column
-                    ].apply(conversion_factor)
+                    # Apply conversion on the values below the unit row
+                    rows = dataframe.index[1:]
+                    dataframe.loc[rows, column] = conversion_factor(
+                        UnitConversion._to_float_array(dataframe.loc[rows, column])
+                    )
                     # Update unit in the first row (assuming it contains unit labels)
                     dataframe.loc[dataframe.index[0], column] = target_unit
                 else:
                     # Apply conversion
-                    dataframe[column] = dataframe[column].apply(conversion_factor)
+                    dataframe[column] = conversion_factor(
+                        UnitConversion._to_float_array(dataframe[column])
+                    )
         return dataframe
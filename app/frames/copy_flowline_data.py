@@ -3,6 +3,7 @@ import threading
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+from app.core import PipsimModellingError
 from app.core.multi_case_modeller import copy_flowline_data
 from app.project import FRAME_STORE, browse_folder_or_file
 
@@ -19,10 +20,15 @@ def submit_copy_flowline_data(
         logger_uc.info("Copying flowline conditions")
         progress_bar.start()
 
-        copy_flowline_data(source_file, destination_folder)
-
-        progress_bar.stop()
-        progress_bar.pack_forget()
+        try:
+            copy_flowline_data(source_file, destination_folder)
+        except PipsimModellingError as e:
+            logger_uc.error(e)
+            messagebox.showerror("Error", str(e))
+            return
+        finally:
+            progress_bar.stop()
+            progress_bar.pack_forget()
         logger_uc.info("Flowline conditions copied successfully")
         messagebox.showinfo("Success", "Flowline conditions copied successfully")
 
@@ -31,7 +37,7 @@ def submit_copy_flowline_data(
 
 def init_update_conditions_frame(app: tk.Tk) -> tk.Frame:
     update_conditions_frame = tk.Frame(app)
-    FRAME_STORE["update_conditions"] = update_conditions_frame
+    FRAME_STORE.update_conditions = update_conditions_frame
     update_label = tk.Label(
         update_conditions_frame, text="Copy Flowline Data Workflow", font=("Arial", 14)
     )
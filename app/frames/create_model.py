@@ -13,18 +13,32 @@ from sixgill.definitions import ModelComponents, Parameters
 
 from app.core import ExcelInputError, PipsimModellingError
 from app.core.excel_handling import ExcelHandler
-from app.core.model_builder import ModelBuilder, create_component_name_df
+from app.core.model_builder import (
+    ModelBuilder,
+    check_sheet_columns,
+    create_component_name_df,
+    read_sheet,
+)
 from app.project import (
     FRAME_STORE,
+    SELECT_SHEET,
+    SHEET_PLACEHOLDERS,
     browse_folder_or_file,
     generate_dict_from_class,
     get_string_values_from_class,
-    update_optionmenu_with_excelsheets,
+    update_combobox_with_excelsheets,
 )
 from app.widgets import DualCascadeListBox, DualSelectableCombobox
 
 logger = logging.getLogger("app.core.model_builder")
 
+# The sixgill definition classes do not change while the app runs.
+_PARAMETER_MAPPING = generate_dict_from_class(Parameters)
+_FLOWLINE_VALUES = tuple(
+    get_string_values_from_class([Parameters.Flowline, Parameters.FlowlineGeometry])
+)
+_DIALOGS: dict[str, tk.Toplevel] = {}
+
 
 ############################################
 # LAYOUT FUNCTIONS
@@ -63,14 +77,14 @@ def create_file_input_frame(
     return frame, entry
 
 
-def create_option_menu_frame(
+def create_combobox_frame(
     parent, variable: tk.StringVar
-) -> tuple[tk.Frame, tk.OptionMenu]:
+) -> tuple[tk.Frame, ttk.Combobox]:
     frame = tk.Frame(parent)
     frame.pack(pady=5)
-    option_menu = tk.OptionMenu(frame, variable, "Select Sheet Name")
-    option_menu.pack()
-    return frame, option_menu
+    combobox = ttk.Combobox(frame, textvariable=variable, state="readonly", width=30)
+    combobox.pack()
+    return frame, combobox
 
 
 def create_radio_buttons_frame(
@@ -84,7 +98,7 @@ def create_radio_buttons_frame(
     frame.pack(pady=5)
 
     def on_radio_button_change():
-        sheet_name_var.set("Select Sheet Name")
+        sheet_name_var.set(SELECT_SHEET)
 
     for option, description in options.items():
 
@@ -144,10 +158,17 @@ def create_submit_button_frame(parent, command) -> tk.Frame:
 def submit_create_model(
     pipesim_file_path: str, excel_file_path: str, sheet_name: str, progress_bar: ttk.Progressbar
 ) -> None:
-    if sheet_name == "Select Sheet Name":
+    if not sheet_name or sheet_name in SHEET_PLACEHOLDERS:
         messagebox.showerror("Error", "Please select a valid sheet name.")
         return
 
+    try:
+        check_sheet_columns(excel_file_path, sheet_name, min_columns=2)
+    except ExcelInputError as e:
+        logger.error(e)
+        messagebox.showerror("Error", f"Error reading Excel file: {e}")
+        return
+
     def task():
         progress_bar.pack(pady=10)
         logger.info("Creating model from scratch")
@@ -171,13 +192,22 @@ def submit_create_model(
 def submit_populate_model(
     pipesim_file_path: str, excel_file_path: str, sheet_name: str, progress_bar: ttk.Progressbar
 ) -> None:
-    if sheet_name == "Select Sheet Name":
+    if not sheet_name or sheet_name in SHEET_PLACEHOLDERS:
         messagebox.showerror("Error", "Please select a valid sheet name.")
         return
 
+    try:
+        check_sheet_columns(
+            excel_file_path, sheet_name, required_columns=["Name", "Component"]
+        )
+    except ExcelInputError as e:
+        logger.error(e)
+        messagebox.showerror("Error", f"Error reading Excel file: {e}")
+        return
+
     def task():
         progress_bar.pack(pady=10)
-        component_data = pd.read_excel(excel_file_path, sheet_name=sheet_name)
+        component_data = read_sheet(excel_file_path, sheet_name)
         try:
             progress_bar.start()
             mb = ModelBuilder(
@@ -200,31 +230,33 @@ def submit_populate_model(
     threading.Thread(target=task).start()
 
 
-def browse_and_update_optionmenu(
-    entry_widget: tk.Entry, option_menu: tk.OptionMenu, variable: tk.StringVar
+def browse_and_update_combobox(
+    entry_widget: tk.Entry, combobox: ttk.Combobox, variable: tk.StringVar
 ) -> None:
     file_path = browse_folder_or_file(
         entry_widget, file_types=[("Excel Files", "*.xlsx *.xls")]
     )
-    update_optionmenu_with_excelsheets(option_menu, variable, file_path)
+    update_combobox_with_excelsheets(combobox, variable, file_path)
 
 
 def open_component_list(parent: tk.Tk) -> None:
-    cascade_box = DualCascadeListBox(
-        parent,
-        title="Refer the list of available parameters",
-        child_mapping=generate_dict_from_class(Parameters),
-    )
-    parent.wait_window(cascade_box)
+    cascade_box = _DIALOGS.get("component_list")
+    if cascade_box is None or not cascade_box.winfo_exists():
+        cascade_box = DualCascadeListBox(
+            parent,
+            title="Refer the list of available parameters",
+            child_mapping=_PARAMETER_MAPPING,
+            hide_on_close=True,
+        )
+        _DIALOGS["component_list"] = cascade_box
+    cascade_box.show()
 
 
 def open_flowline_parameters(parent: tk.Tk) -> None:
     combobox = DualSelectableCombobox(
         parent,
         title="Refer the list of available flowline parameters",
-        values=get_string_values_from_class(
-            [Parameters.Flowline, Parameters.FlowlineGeometry]
-        ),
+        values=list(_FLOWLINE_VALUES),
         mode="dual",
     )
     parent.wait_window(combobox)
@@ -253,7 +285,7 @@ def create_excel_with_selected_parameters(
 
 def init_create_model_frame(app: tk.Tk) -> tk.Frame:
     create_model_frame = tk.Frame(app)
-    FRAME_STORE["create_model"] = create_model_frame
+    FRAME_STORE.create_model = create_model_frame
 
     create_title_frame(create_model_frame)
 
@@ -265,14 +297,14 @@ def init_create_model_frame(app: tk.Tk) -> tk.Frame:
     excel_frame, excel_file_entry = create_file_input_frame(
         create_model_frame,
         "Excel File",
-        lambda: browse_and_update_optionmenu(
+        lambda: browse_and_update_combobox(
             excel_file_entry, sheet_name_dropdown, sheet_name_var
         ),
     )
 
     sheet_name_var = tk.StringVar()
-    sheet_name_var.set("Select Sheet Name")
-    sheet_name_frame, sheet_name_dropdown = create_option_menu_frame(
+    sheet_name_var.set(SELECT_SHEET)
+    sheet_name_frame, sheet_name_dropdown = create_combobox_frame(
         create_model_frame, sheet_name_var
     )
 
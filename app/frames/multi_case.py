@@ -13,7 +13,7 @@ from app.core.multi_case_modeller import MultiCaseModeller
 from app.project import (
     FRAME_STORE,
     browse_folder_or_file,
-    update_optionmenu_with_excelsheets,
+    update_comboboxes_with_excelsheets,
 )
 
 logger = logging.getLogger("app.core.multi_case_modeller")
@@ -63,16 +63,16 @@ def create_file_input_frame(
     return frame, entry
 
 
-def create_option_menu_frame(
+def create_combobox_frame(
     parent, variable: tk.StringVar, label_text: str = "Label"
-) -> tuple[tk.Frame, tk.OptionMenu]:
+) -> tuple[tk.Frame, ttk.Combobox]:
     frame = tk.Frame(parent)
     frame.pack(pady=5)
     label = tk.Label(frame, text=label_text)
     label.pack()
-    option_menu = tk.OptionMenu(frame, variable, "Select Sheet Name")
-    option_menu.pack()
-    return frame, option_menu
+    combobox = ttk.Combobox(frame, textvariable=variable, state="readonly", width=30)
+    combobox.pack()
+    return frame, combobox
 
 
 def create_submit_button_frame(parent, command) -> tk.Frame:
@@ -83,14 +83,10 @@ def create_submit_button_frame(parent, command) -> tk.Frame:
     return frame
 
 
-def browse_and_update_optionmenu(entry_widget, option_menus: list, variables: list):
+def browse_and_update_comboboxes(entry_widget, comboboxes: list, variables: list):
     path = browse_folder_or_file(entry_widget, file_types=[("Excel Files", "*.xlsx")])
     if path:
-        # update_optionmenu_with_excelsheets(option_menu, variable, excel_file_path=path)
-        for option_menu, variable in zip(option_menus, variables):
-            update_optionmenu_with_excelsheets(
-                option_menu, variable, excel_file_path=path
-            )
+        update_comboboxes_with_excelsheets(comboboxes, variables, excel_file_path=path)
 
 
 def submit_multi_case_workflow(
@@ -130,7 +126,7 @@ def submit_multi_case_workflow(
 
 def init_multi_case_frame(app: tk.Tk) -> tk.Frame:
     multi_case_frame = tk.Frame(app)
-    FRAME_STORE["multi_case"] = multi_case_frame
+    FRAME_STORE.multi_case = multi_case_frame
 
     create_title_frame(multi_case_frame)
 
@@ -139,28 +135,26 @@ def init_multi_case_frame(app: tk.Tk) -> tk.Frame:
     excel_frame, excel_file_entry = create_file_input_frame(
         multi_case_frame,
         "Excel File",
-        lambda: browse_and_update_optionmenu(
+        lambda: browse_and_update_comboboxes(
             excel_file_entry,
             [well_profile_sheet_dropdown, conditions_sheet_dropdown],
             [well_profile_sheet_var, conditions_sheet_var],
         ),
     )
 
-    well_profile_sheet_var = tk.StringVar()
-    well_profile_sheet_var.set("Select Sheet Name")
     sheet_frames = tk.Frame(multi_case_frame)
     sheet_frames.pack(pady=5)
 
     well_profile_sheet_var = tk.StringVar()
     well_profile_sheet_var.set("Select Sheet Name")
-    well_profile_sheet_frame, well_profile_sheet_dropdown = create_option_menu_frame(
+    well_profile_sheet_frame, well_profile_sheet_dropdown = create_combobox_frame(
         sheet_frames, well_profile_sheet_var, "Well Profile Sheet Name"
     )
     well_profile_sheet_frame.pack(side=tk.LEFT, padx=10)
 
     conditions_sheet_var = tk.StringVar()
     conditions_sheet_var.set("Select Sheet Name")
-    conditions_sheet_frame, conditions_sheet_dropdown = create_option_menu_frame(
+    conditions_sheet_frame, conditions_sheet_dropdown = create_combobox_frame(
         sheet_frames, conditions_sheet_var, "Conditions Sheet Name"
     )
     conditions_sheet_frame.pack(side=tk.LEFT, padx=10)
@@ -175,15 +169,14 @@ def init_multi_case_frame(app: tk.Tk) -> tk.Frame:
 
     sink_parameter_var = tk.StringVar()
     sink_parameter_var.set(Parameters.Sink.LIQUIDFLOWRATE)
-    sink_parameter_frame, sink_parameter_dropdown = create_option_menu_frame(
+    sink_parameter_frame, sink_parameter_dropdown = create_combobox_frame(
         multi_case_frame, sink_parameter_var, "Sink Parameter"
     )
-    sink_parameter_dropdown["menu"].delete(0, "end")
-    for option in Parameters.Sink.__dict__.values():
-        if isinstance(option, str):
-            sink_parameter_dropdown["menu"].add_command(
-                label=option, command=lambda value=option: sink_parameter_var.set(value)
-            )
+    sink_parameter_dropdown["values"] = tuple(
+        option
+        for option in Parameters.Sink.__dict__.values()
+        if isinstance(option, str)
+    )
 
     progress_bar = ttk.Progressbar(multi_case_frame, mode="indeterminate")
 
@@ -8,59 +8,222 @@ import logging
 import os
 import threading
 import tkinter as tk
+from concurrent.futures import FIRST_COMPLETED, wait
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
+from typing import Callable, NamedTuple, Optional
 
 from sixgill.definitions import ProfileVariables, SystemVariables, Units
 
 from app.core import NetworkSimulationError
-from app.core.network_simulation import NetworkSimulator
-from app.project import FRAME_STORE, browse_folder_or_file, get_string_values_from_class
+from app.core.excel_handling import ExcelHandlerError
+from app.core.network_simulation import (
+    NetworkSimulator,
+    get_simulation_pool,
+    simulate_model,
+)
+from app.project import (
+    FRAME_STORE,
+    browse_folder_or_file,
+    get_string_values_from_class,
+    open_file,
+)
 from app.widgets.dual_combo_box import DualSelectableCombobox
 
+try:
+    import orjson
+except ImportError:  # optional, the json module is used instead
+    orjson = None
+
 logger = logging.getLogger("app.core.network_simulation")
 
+# The sixgill definition classes do not change while the app runs.
+_SYSTEM_VAR_NAMES = tuple(get_string_values_from_class(SystemVariables))
+_PROFILE_VAR_NAMES = tuple(get_string_values_from_class(ProfileVariables))
+_UNIT_NAMES = tuple(get_string_values_from_class(Units))
+
+_results_button_frame: Optional[tk.Frame] = None  # from the latest run
+_MAX_LISTED_FAILURES = 10  # failed models named in the end-of-run dialog
+
+
+class RunOptions(NamedTuple):
+    """
+    Optional controls of a simulation run.
+
+    Attributes:
+        max_workers (Optional[int]): Number of worker processes. Defaults to the
+            number of CPUs. The processes are kept for later runs.
+        cancel_event (Optional[threading.Event]): When set, models that have not
+            started are dropped and the run stops after the running ones.
+        on_finish (Optional[Callable[[], None]]): Called on the Tk main thread when
+            the run has ended, e.g. to enable the controls disabled for the run.
+    """
+
+    max_workers: Optional[int] = None
+    cancel_event: Optional[threading.Event] = None
+    on_finish: Optional[Callable[[], None]] = None
 
-def run_simulation(folder_path, system_vars, profile_vars, unit, parent, progress_bar):
+
+def run_simulation(
+    folder_path,
+    system_vars,
+    profile_vars,
+    unit,
+    parent,
+    progress_bar,
+    options: RunOptions = RunOptions(),
+):
     """
-    Excutes the run_existing_model method of the NetworkSimulator class for all .pips files in the specified folder.
-    i.e., Run the simulation for each .pips file in the folder.
+    Runs the simulation for each .pips file in the folder.
+    The models are simulated in parallel worker processes; their results are written
+    to the results workbooks on a background thread, one model at a time, as each
+    finishes. Widgets are only updated from the Tk main thread.
 
     Args:
         folder_path (str or Path): The path to the folder containing .pips files.
         system_vars (list): List of system variables to be used in the simulation.
         profile_vars (list): List of profile variables to be used in the simulation.
         unit (str): Unit to be used in the simulation.
+        parent (tk.Frame): Frame that gets the result buttons when the run ends.
+        progress_bar (ttk.Progressbar): Progress bar shown while the run is active.
+        options (RunOptions, optional): Worker count and cancel event of the run.
 
     Raises:
         Exception: If an error occurs during the simulation of any .pips file, it will be caught and printed.
     """
+    folder = Path(folder_path)
+    max_workers, cancel_event, on_finish = options
+    logger.info("Running simulation")
+    logger.debug(
+        f"System Variables: {system_vars}, Profile Variables: {profile_vars}, Unit: {unit}"
+    )
+    progress_bar.pack(pady=10)
+    progress_bar.start()
 
-    def task():
-        progress_bar.pack(pady=10)
-        logger.info("Running simulation")
-        folder = Path(folder_path)
-        logger.debug(
-            f"System Variables: {system_vars}, Profile Variables: {profile_vars}, Unit: {unit}"
-        )
-
-        progress_bar.start()
-        for pips_file in folder.glob("*.pips"):
-            try:
-                ns = NetworkSimulator(
-                    str(pips_file), system_vars, profile_vars, unit, folder=str(folder)
-                )
-                ns.run_existing_model()
-            except NetworkSimulationError as e:
-                logger.error(e)
+    def finish(cancelled: bool, total: int, written: int, errors: list) -> None:
         progress_bar.stop()
         progress_bar.pack_forget()
-        create_results_button_frame(
-            parent, ns.NODE_RESULTS_FILE, ns.PROFILE_RESULTS_FILE
-        )
-        messagebox.showinfo("Success", "Simulation completed successfully")
+        if on_finish is not None:
+            on_finish()
+        if written:
+            results_folder = folder.absolute()
+            create_results_button_frame(
+                parent,
+                str(results_folder / NetworkSimulator.NODE_RESULTS_FILE),
+                str(results_folder / NetworkSimulator.PROFILE_RESULTS_FILE),
+            )
+        if errors:
+            lines = [f"{name}: {message}" for name, message in errors]
+            if len(lines) > _MAX_LISTED_FAILURES:
+                hidden = len(lines) - _MAX_LISTED_FAILURES
+                lines = lines[:_MAX_LISTED_FAILURES] + [f"... and {hidden} more"]
+            status = "cancelled" if cancelled else "finished"
+            message = (
+                f"Simulation {status}: {written} of {total} models written, "
+                f"{len(errors)} failed.\n\n" + "\n".join(lines)
+            )
+            if written:
+                messagebox.showwarning("Simulation failures", message)
+            else:
+                messagebox.showerror("Simulation failed", message)
+        elif not total:
+            messagebox.showwarning("No models", f"No .pips files found in:\n{folder}")
+        elif cancelled:
+            messagebox.showinfo("Cancelled", "Simulation cancelled")
+        else:
+            messagebox.showinfo("Success", "Simulation completed successfully")
 
-    threading.Thread(target=task).start()
+    def task():
+        cancelled = False
+        total = 0
+        errors = []
+        written = []
+        try:
+            cancelled, total = run_models(errors, written)
+        except Exception as e:  # the controls must come back even if the run breaks
+            logger.error(f"Simulation run stopped: {e}")
+            errors.append((folder.name, str(e)))
+        parent.after(0, finish, cancelled, total, len(written), errors)
+
+    def run_models(errors: list, written: list) -> tuple:
+        """
+        Simulates the models, filling errors and written as they finish.
+        Returns whether the run was cancelled and the number of models found.
+        """
+        # DirEntry caches the file type, and on Windows the size, from the listing.
+        try:
+            with os.scandir(folder) as entries:
+                pips_entries = [
+                    entry
+                    for entry in entries
+                    if entry.name.lower().endswith(".pips") and entry.is_file()
+                ]
+        except OSError as e:
+            logger.error(f"Could not list the folder {folder}: {e}")
+            pips_entries = []
+        # Largest models first, so a big one does not start last and run alone.
+        pips_entries.sort(key=lambda entry: entry.stat().st_size, reverse=True)
+        pips_files = [entry.path for entry in pips_entries]
+        total = len(pips_files)
+        logger.info(f"Found {total} models in {folder}")
+        NetworkSimulator.clear_results(str(folder))
+        executor = get_simulation_pool(max_workers or os.cpu_count() or 1)
+        futures = {
+            executor.submit(
+                simulate_model,
+                pips_file,
+                system_vars,
+                profile_vars,
+                unit,
+                str(folder),
+            ): pips_file
+            for pips_file in pips_files
+        }
+        pending = set(futures)
+        cancelled = False
+        finished = 0
+        while pending:
+            if cancel_event is not None and cancel_event.is_set() and not cancelled:
+                cancelled = True
+                for future in pending:
+                    future.cancel()
+                logger.warning("Simulation cancelled, waiting for running models.")
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.cancelled():
+                    continue
+                pips_file = futures[future]
+                name = os.path.basename(pips_file)
+                finished += 1
+                try:
+                    NetworkSimulator.write_results(
+                        pips_file, str(folder), future.result()
+                    )
+                    written.append(name)
+                    logger.info(f"({finished}/{total}) Simulation completed: {name}")
+                except (NetworkSimulationError, ExcelHandlerError) as e:
+                    errors.append((name, str(e)))
+                    logger.info(f"({finished}/{total}) Simulation failed: {name}")
+                except Exception as e:
+                    errors.append((name, f"An error occurred during simulation: {e}"))
+                    logger.info(f"({finished}/{total}) Simulation failed: {name}")
+        if errors:
+            logger.error(
+                f"Failed {len(errors)}/{total} models:\n"
+                + "\n".join(f"  {name}: {message}" for name, message in errors)
+            )
+        return cancelled, total
+
+    threading.Thread(target=task, daemon=True).start()
+
+
+def get_max_workers(workers_var: tk.IntVar) -> int:
+    """Returns the requested number of parallel simulations, limited to 1..CPU count."""
+    cpu_count = os.cpu_count() or 1
+    try:
+        return min(max(1, workers_var.get()), cpu_count)
+    except tk.TclError:  # empty or non-numeric entry
+        return max(1, cpu_count // 2)
 
 
 def open_checkable_combobox(parent, title, values, listbox):
@@ -68,8 +231,8 @@ def open_checkable_combobox(parent, title, values, listbox):
     parent.wait_window(combobox)
     selected_values = combobox.confirm_selection()
     listbox.delete(0, tk.END)
-    for val in selected_values:
-        listbox.insert(tk.END, val)
+    if selected_values:
+        listbox.insert(tk.END, *selected_values)
 
 
 def save_selections(system_vars, profile_vars):
@@ -81,8 +244,12 @@ def save_selections(system_vars, profile_vars):
         defaultextension=".json", filetypes=[("JSON files", "*.json")]
     )
     if file_path:
-        with open(file_path, "w") as f:
-            json.dump(selections, f)
+        if orjson is not None:
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps(selections, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, "w") as f:
+                json.dump(selections, f, indent=2)
         messagebox.showinfo("Success", "Selections saved successfully")
 
 
@@ -91,29 +258,37 @@ def load_selections(system_vars_listbox, profile_vars_listbox):
         filetypes=[("JSON files", "*.json")], title="Select a JSON file"
     )
     if file_path:
-        with open(file_path, "r") as f:
-            selections = json.load(f)
+        with open(file_path, "rb") as f:
+            data = f.read()
+        selections = orjson.loads(data) if orjson is not None else json.loads(data)
+        system_vars = selections.get("system_vars", [])
+        profile_vars = selections.get("profile_vars", [])
         system_vars_listbox.delete(0, tk.END)
-        for var in selections.get("system_vars", []):
-            system_vars_listbox.insert(tk.END, var)
+        if system_vars:
+            system_vars_listbox.insert(tk.END, *system_vars)
         profile_vars_listbox.delete(0, tk.END)
-        for var in selections.get("profile_vars", []):
-            profile_vars_listbox.insert(tk.END, var)
+        if profile_vars:
+            profile_vars_listbox.insert(tk.END, *profile_vars)
         messagebox.showinfo("Success", "Selections loaded successfully")
 
 
 def create_results_button_frame(run_simulation_frame, node_results, profile_results):
+    """Shows the result buttons, replacing the ones from a previous run."""
+    global _results_button_frame
+    if _results_button_frame is not None and _results_button_frame.winfo_exists():
+        _results_button_frame.destroy()
     results_button_frame = tk.Frame(run_simulation_frame)
+    _results_button_frame = results_button_frame
     results_button_frame.pack(pady=10)
     node_results_button = tk.Button(
         results_button_frame,
         text="Node Results",
-        command=lambda: os.startfile(node_results),
+        command=lambda: open_file(node_results),
     )
     profile_results_button = tk.Button(
         results_button_frame,
         text="Profile Results",
-        command=lambda: os.startfile(profile_results),
+        command=lambda: open_file(profile_results),
     )
     node_results_button.pack(side=tk.LEFT, padx=5)
     profile_results_button.pack(side=tk.LEFT, padx=5)
@@ -122,7 +297,7 @@ def create_results_button_frame(run_simulation_frame, node_results, profile_resu
 
 def init_run_simulation_frame(app):
     run_simulation_frame = tk.Frame(app)
-    FRAME_STORE["run_simulation"] = run_simulation_frame
+    FRAME_STORE.run_simulation = run_simulation_frame
     run_label = tk.Label(
         run_simulation_frame, text="Run Simulation Workflow", font=("Arial", 14)
     )
@@ -167,7 +342,7 @@ def init_run_simulation_frame(app):
         command=lambda: open_checkable_combobox(
             app,
             "Select System Variables",
-            get_string_values_from_class(SystemVariables),
+            list(_SYSTEM_VAR_NAMES),
             system_vars_listbox,
         ),
     )
@@ -181,10 +356,26 @@ def init_run_simulation_frame(app):
     unit_var = tk.StringVar(run_simulation_frame)
     unit_var.set(Units.METRIC)
     unit_optionmenu = tk.OptionMenu(
-        center_frame, unit_var, *get_string_values_from_class(Units)
+        center_frame, unit_var, *_UNIT_NAMES
     )
     unit_optionmenu.pack(pady=5)
 
+    # More parallel runs than CPU cores rarely helps and each one holds a model in
+    # memory, so large models may need a lower value.
+    workers_label = tk.Label(center_frame, text="Parallel Simulations")
+    workers_label.pack(pady=5)
+    workers_var = tk.IntVar(
+        run_simulation_frame, value=max(1, (os.cpu_count() or 1) // 2)
+    )
+    workers_spinbox = tk.Spinbox(
+        center_frame,
+        from_=1,
+        to=os.cpu_count() or 1,
+        textvariable=workers_var,
+        width=5,
+    )
+    workers_spinbox.pack(pady=5)
+
     ## Buttons
     save_button = tk.Button(
         center_frame,
@@ -205,20 +396,39 @@ def init_run_simulation_frame(app):
 
     progress_bar = ttk.Progressbar(run_simulation_frame, mode="indeterminate")
 
-    run_button_rs = tk.Button(
-        center_frame,
-        text="Run Simulations",
-        command=lambda: run_simulation(
+    cancel_event = threading.Event()
+
+    def set_run_controls(state: str) -> None:
+        run_button_rs.config(state=state)
+        workers_spinbox.config(state=state)
+
+    def on_run() -> None:
+        # One run at a time: a second run would clear the cancel request and
+        # write to the same results workbooks as the first.
+        set_run_controls(tk.DISABLED)
+        cancel_event.clear()
+        run_simulation(
             folder_entry_rs.get(),
             list(system_vars_listbox.get(0, tk.END)),
             list(profile_vars_listbox.get(0, tk.END)),
             unit_var.get(),
             run_simulation_frame,
             progress_bar,
-        ),
-    )
+            RunOptions(
+                get_max_workers(workers_var),
+                cancel_event,
+                on_finish=lambda: set_run_controls(tk.NORMAL),
+            ),
+        )
+
+    run_button_rs = tk.Button(center_frame, text="Run Simulations", command=on_run)
     run_button_rs.config(font=("Arial", 12, "bold"), height=1, width=20)
-    run_button_rs.pack(pady=40)
+    run_button_rs.pack(pady=(40, 5))
+
+    cancel_button_rs = tk.Button(
+        center_frame, text="Cancel", command=cancel_event.set, width=20
+    )
+    cancel_button_rs.pack(pady=5)
 
     # Profile Variables Listbox
     profile_vars_frame = tk.Frame(variables_frame)
@@ -235,7 +445,7 @@ def init_run_simulation_frame(app):
         command=lambda: open_checkable_combobox(
             app,
             "Select Profile Variables",
-            get_string_values_from_class(ProfileVariables),
+            list(_PROFILE_VAR_NAMES),
             profile_vars_listbox,
         ),
     )
@@ -31,7 +31,7 @@ def summarize(progress_bar):
 
 def init_summarize_frame(app):
     summarize_frame = tk.Frame(app)
-    FRAME_STORE["summarize"] = summarize_frame
+    FRAME_STORE.summarize = summarize_frame
     summarize_label = tk.Label(
         summarize_frame, text="Summarize Data", font=("Arial", 14)
     )
@@ -1,18 +1,43 @@
 import inspect
-import logging
-import logging.config
 import tkinter as tk
 import webbrowser
 import os
-from tkinter import filedialog, messagebox
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from tkinter import filedialog, messagebox, ttk
+from types import SimpleNamespace
 from typing import Dict, List
 
-import pandas as pd
-import yaml
-
 from app.config import BASE_URL
+from app.core.excel_handling import ExcelHandler
+
+
+class FrameStore(SimpleNamespace):
+    """The application's top-level frames, registered by their init_*_frame."""
+
+    home: tk.Frame
+    create_model: tk.Frame
+    update_conditions: tk.Frame
+    run_simulation: tk.Frame
+    summarize: tk.Frame
+    multi_case: tk.Frame
+    access_denied: tk.Frame
+
+    def values(self):
+        return vars(self).values()
+
+
+FRAME_STORE = FrameStore()
+_EXCEL_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="excel")
+_SHEET_LOOKUPS: dict[str, Future] = {}  # in-flight lookups by path, main thread only
+_COMBOBOX_REQUESTS: dict[str, Future] = {}  # latest lookup per Combobox
 
-FRAME_STORE: dict[str, tk.Frame] = {}
+SELECT_SHEET = "Select Sheet Name"
+SHEET_LOADING = "Loading…"
+NO_SHEETS = "No sheets available"
+# Texts a sheet combobox shows in place of a real sheet name.
+SHEET_PLACEHOLDERS = frozenset({SELECT_SHEET, SHEET_LOADING, NO_SHEETS})
 
 
 def switch_frame(new_frame: tk.Frame):
@@ -21,6 +46,17 @@ def switch_frame(new_frame: tk.Frame):
     new_frame.pack(fill="both", expand=True)
 
 
+def open_file(path: str) -> None:
+    """
+    Opens a file or folder with its default application without blocking the GUI.
+    Shows an error instead if the path does not exist.
+    """
+    if not os.path.exists(path):
+        messagebox.showerror("Error", f"File not found: {path}")
+        return
+    threading.Thread(target=os.startfile, args=(path,), daemon=True).start()
+
+
 def browse_folder_or_file(
     entry_widget: tk.Entry,
     file_types: list[tuple[str, str]] | None = None,
@@ -45,20 +81,14 @@ def browse_folder_or_file(
             if isinstance(widget, tk.Button) and widget.cget("text") == "Open":
                 widget.destroy()
         
-        open_button = tk.Button(entry_widget.master, text="Open", command=lambda: os.startfile(path))
+        open_button = tk.Button(entry_widget.master, text="Open", command=lambda: open_file(path))
         open_button.pack(side="left", padx=5, pady=5)
         
     return path
 
 
-def setup_logger():
-    with open("logging.yml", "r") as f:
-        config = yaml.safe_load(f.read())
-    config["handlers"] = {"console": config["handlers"]["console"]}
-    logging.config.dictConfig(config)
-
-
-def get_string_values_from_class(class_names: type | list[type]) -> list:
+@lru_cache(maxsize=None)
+def _string_values_from_classes(class_names: tuple[type, ...]) -> tuple[str, ...]:
     def extract_string_values(class_name):
         return sorted(
             [
@@ -76,14 +106,21 @@ def get_string_values_from_class(class_names: type | list[type]) -> list:
                 break
             combined_values.update(extract_string_values(_class))
         return combined_values
-    
-    if isinstance(class_names, list):
-        for class_name in class_names:
-            get_inherited_classes(class_name)
-    else:
-        get_inherited_classes(class_names)
-    
-    return sorted(combined_values)
+
+    for class_name in class_names:
+        get_inherited_classes(class_name)
+
+    return tuple(sorted(combined_values))
+
+
+def get_string_values_from_class(class_names: type | list[type]) -> list:
+    """
+    Returns the sorted string attributes of one or more classes, including inherited
+    ones. The classes are walked once per process; callers get their own list.
+    """
+    if not isinstance(class_names, list):
+        class_names = [class_names]
+    return list(_string_values_from_classes(tuple(class_names)))
 
 
 def get_class_by_name(abstract_class: type, class_name: str) -> type:
@@ -98,32 +135,68 @@ def get_class_by_name(abstract_class: type, class_name: str) -> type:
         raise ValueError(f"Class '{class_name}' not found in Parameters.")
 
 
-def generate_dict_from_class(class_name: type) -> Dict[str, List[str]]:
-    """
-    Generates a dictionary from a class with string attributes.
-    """
-
+@lru_cache(maxsize=None)
+def _dict_from_class(class_name: type) -> Dict[str, tuple[str, ...]]:
     def is_valid_component(component):
         return not component.startswith("__")
 
     components = sorted(filter(is_valid_component, class_name.__dict__.keys()))
     return {
-        component: get_string_values_from_class(
-            get_class_by_name(class_name, component)
+        component: _string_values_from_classes(
+            (get_class_by_name(class_name, component),)
         )
         for component in components
     }
 
 
-def update_optionmenu_with_excelsheets(
-    option_menu: tk.OptionMenu, variable: tk.StringVar, excel_file_path: str
+def generate_dict_from_class(class_name: type) -> Dict[str, List[str]]:
+    """
+    Generates a dictionary from a class with string attributes.
+    The class is walked once per process; callers get their own lists.
+    """
+    return {
+        component: list(values)
+        for component, values in _dict_from_class(class_name).items()
+    }
+
+
+@lru_cache(maxsize=32)
+def _read_sheet_names(
+    excel_file_path: str, mtime: float, size: int
+) -> tuple[str, ...]:
+    return tuple(ExcelHandler.get_sheet_names(excel_file_path))
+
+
+def get_sheet_names(excel_file_path: str) -> list[str]:
+    """
+    Returns the sheet names of an Excel file. The names are cached per file and
+    read again only when the file's modification time or size changes.
+    """
+    stat = os.stat(excel_file_path)
+    return list(_read_sheet_names(excel_file_path, stat.st_mtime, stat.st_size))
+
+
+def _populate_combobox(
+    combobox: ttk.Combobox, variable: tk.StringVar, sheets: list[str]
+) -> None:
+    combobox["values"] = tuple(sheets)
+    variable.set(SELECT_SHEET if sheets else NO_SHEETS)
+
+
+def update_comboboxes_with_excelsheets(
+    comboboxes: list[ttk.Combobox],
+    variables: list[tk.StringVar],
+    excel_file_path: str,
 ) -> None:
     """
-    Updates the given Tkinter OptionMenu with the sheet names from the specified Excel file.
+    Updates several sheet comboboxes with the sheet names of one Excel file.
+    The workbook is read once on a worker thread; the comboboxes are disabled and
+    show a loading entry meanwhile. A path that is already being read is not read
+    again, and only the latest request fills the comboboxes.
 
     Args:
-        option_menu (tk.OptionMenu): The OptionMenu widget to update.
-        variable (tk.StringVar): The Tkinter StringVar associated with the OptionMenu.
+        comboboxes (list[ttk.Combobox]): The Combobox widgets to update.
+        variables (list[tk.StringVar]): The StringVar of each Combobox.
         excel_file_path (str): The file path to the Excel file.
 
     Returns:
@@ -132,17 +205,60 @@ def update_optionmenu_with_excelsheets(
     Raises:
         None. Displays an error message using messagebox.showerror if the Excel file cannot be read.
     """
-    try:
-        sheets = pd.ExcelFile(excel_file_path).sheet_names
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to read Excel file: {e}")
+    if not comboboxes:
         return
+    future = _SHEET_LOOKUPS.get(excel_file_path)
+    if future is None:
+        future = _EXCEL_POOL.submit(get_sheet_names, excel_file_path)
+        _SHEET_LOOKUPS[excel_file_path] = future
+    for combobox, variable in zip(comboboxes, variables):
+        _COMBOBOX_REQUESTS[str(combobox)] = future
+        combobox["values"] = ()
+        combobox.config(state="disabled")
+        variable.set(SHEET_LOADING)
+    scheduler = comboboxes[0]
+
+    def apply_result() -> None:
+        if not future.done():
+            scheduler.after(50, apply_result)
+            return
+        if _SHEET_LOOKUPS.get(excel_file_path) is future:
+            del _SHEET_LOOKUPS[excel_file_path]
+        current = [
+            (combobox, variable)
+            for combobox, variable in zip(comboboxes, variables)
+            if _COMBOBOX_REQUESTS.get(str(combobox)) is future
+        ]
+        if not current:
+            return  # superseded by a later browse
+        for combobox, _ in current:
+            del _COMBOBOX_REQUESTS[str(combobox)]
+            combobox.config(state="readonly")
+        try:
+            sheets = future.result()
+        except Exception as e:
+            for _, variable in current:
+                variable.set(SELECT_SHEET)
+            messagebox.showerror("Error", f"Failed to read Excel file: {e}")
+            return
+        for combobox, variable in current:
+            _populate_combobox(combobox, variable, sheets)
+
+    scheduler.after(0, apply_result)
+
 
-    menu = option_menu["menu"]
-    menu.delete(0, "end")
-    for sheet in sheets:
-        menu.add_command(label=sheet, command=lambda v=sheet: variable.set(v))
-    variable.set("Select Sheet Name" if sheets else "No sheets available")
+def update_combobox_with_excelsheets(
+    combobox: ttk.Combobox, variable: tk.StringVar, excel_file_path: str
+) -> None:
+    """
+    Updates the given sheet combobox with the sheet names from the specified Excel file.
+
+    Args:
+        combobox (ttk.Combobox): The Combobox widget to update.
+        variable (tk.StringVar): The Tkinter StringVar associated with the Combobox.
+        excel_file_path (str): The file path to the Excel file.
+    """
+    update_comboboxes_with_excelsheets([combobox], [variable], excel_file_path)
 
 
 def open_documentation():
@@ -7,6 +7,8 @@ class DualCascadeListBox(tk.Toplevel):
     """
     Displays two listboxes with respective search bars.
     Selecting an item in the parent list updates the child list.
+    With hide_on_close the window is withdrawn instead of destroyed, so it can be
+    shown again with show().
     """
 
     def __init__(
@@ -14,6 +16,7 @@ class DualCascadeListBox(tk.Toplevel):
         parent: tk.Tk,
         title: str,
         child_mapping: Dict[str, List[str]],
+        hide_on_close: bool = False,
     ):
         super().__init__(parent)
         self.title(title)
@@ -26,6 +29,8 @@ class DualCascadeListBox(tk.Toplevel):
 
         self.parent_search_var = tk.StringVar()
         self.child_search_var = tk.StringVar()
+        self.hide_on_close = hide_on_close
+        self._closed = tk.BooleanVar(self, value=False)
 
         # Make the frame's grid cells expandable
         self.grid_rowconfigure(0, weight=1)
@@ -33,7 +38,7 @@ class DualCascadeListBox(tk.Toplevel):
         self.grid_columnconfigure(1, weight=1)
 
         self.build_ui()
-        self.protocol("WM_DELETE_WINDOW", self.destroy)
+        self.protocol("WM_DELETE_WINDOW", self.close_window)
         self.grab_set()
 
     def build_ui(self):
@@ -96,13 +101,13 @@ class DualCascadeListBox(tk.Toplevel):
 
     def populate_parent_list(self):
         self.parent_listbox.delete(0, tk.END)
-        for item in self.filtered_parents:
-            self.parent_listbox.insert(tk.END, item)
+        if self.filtered_parents:
+            self.parent_listbox.insert(tk.END, *self.filtered_parents)
 
     def populate_child_list(self):
         self.child_listbox.delete(0, tk.END)
-        for item in self.filtered_children:
-            self.child_listbox.insert(tk.END, item)
+        if self.filtered_children:
+            self.child_listbox.insert(tk.END, *self.filtered_children)
 
     def filter_parent_list(self, event=None):
         search_term = self.parent_search_var.get().lower()
@@ -117,8 +122,8 @@ class DualCascadeListBox(tk.Toplevel):
             c for c in self.filtered_children if search_term in c.lower()
         ]
         self.child_listbox.delete(0, tk.END)
-        for item in displayed_children:
-            self.child_listbox.insert(tk.END, item)
+        if displayed_children:
+            self.child_listbox.insert(tk.END, *displayed_children)
 
     def update_child_list(self, event=None):
         selection = self.parent_listbox.curselection()
@@ -140,5 +145,17 @@ class DualCascadeListBox(tk.Toplevel):
             self.clipboard_clear()
             self.clipboard_append(self.child_listbox.get(selection[0]))
 
+    def show(self):
+        """Show the window and block until it is closed."""
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        self.wait_variable(self._closed)
+
     def close_window(self):
-        self.destroy()
+        if self.hide_on_close:
+            self.grab_release()
+            self.withdraw()
+            self._closed.set(True)
+        else:
+            self.destroy()
@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Set
 
 
 class DualSelectableCombobox(tk.Toplevel):
@@ -13,7 +13,9 @@ class DualSelectableCombobox(tk.Toplevel):
         self.title(title)
         self.geometry("800x400")  # Increase the size of the window
         self.values: List[str] = values
+        self._values_lower: List[str] = [val.lower() for val in values]
         self.selected_values: List[str] = []  # List to maintain order
+        self._selected_set: Set[str] = set()  # Membership checks for selected_values
         self.mode: str = mode  # Mode can be 'single' or 'dual'
 
         # Create the main frame
@@ -33,7 +35,7 @@ class DualSelectableCombobox(tk.Toplevel):
         self.search_var = tk.StringVar()
         self.search_entry = ttk.Entry(self.main_frame, textvariable=self.search_var)
         self.search_entry.grid(row=1, column=0, padx=5, pady=(0, 5), sticky="ew")
-        self.search_var.trace_add("write", self.update_available_list)
+        self.search_var.trace_add("write", self._schedule_filter)
 
         # Available listbox
         self.available_listbox = tk.Listbox(
@@ -57,7 +59,11 @@ class DualSelectableCombobox(tk.Toplevel):
         self.filtered_values: List[str] = list(
             self.values
         )  # Keep a filtered list for searching
-        self.update_available_list()
+        self._displayed: List[str] = []  # Mirrors the available listbox rows
+        # Fill the list once the window is drawn so it opens without a stall.
+        self._pending_filter_id: Optional[str] = self.after_idle(
+            self.update_available_list
+        )
 
         if self.mode == "dual":
             # Buttons to move items
@@ -114,13 +120,41 @@ class DualSelectableCombobox(tk.Toplevel):
         )
         self.confirm_button.pack(pady=10)
 
+    def _schedule_filter(self, *args: Any) -> None:
+        """Filter once typing pauses instead of on every keystroke."""
+        if self._pending_filter_id is not None:
+            self.after_cancel(self._pending_filter_id)
+        self._pending_filter_id = self.after(100, self.update_available_list)
+
     def update_available_list(self, *args: Any) -> None:
         """Update available listbox based on search entry."""
+        self._pending_filter_id = None
         search_term = self.search_var.get().lower()
-        self.available_listbox.delete(0, tk.END)
-        for val in self.values:
-            if search_term in val.lower():
-                self.available_listbox.insert(tk.END, val)
+        filtered = [
+            val
+            for val, val_lower in zip(self.values, self._values_lower)
+            if search_term in val_lower
+        ]
+        if filtered == self._displayed:
+            return
+
+        # Only touch the rows that changed, unless rebuilding is cheaper.
+        matching = set(filtered)
+        stale = [i for i, val in enumerate(self._displayed) if val not in matching]
+        kept = [val for val in self._displayed if val in matching]
+        kept_set = set(kept)
+        in_order = kept == [val for val in filtered if val in kept_set]
+        changes = len(stale) + len(filtered) - len(kept)
+        if not in_order or changes > len(filtered) // 2:
+            self.available_listbox.delete(0, tk.END)
+            self.available_listbox.insert(tk.END, *filtered)
+        else:
+            for index in reversed(stale):
+                self.available_listbox.delete(index)
+            for index, val in enumerate(filtered):
+                if val not in kept_set:
+                    self.available_listbox.insert(index, val)
+        self._displayed = filtered
 
     def add_to_selected(self) -> None:
         """Move selected items from Available to Selected."""
@@ -129,10 +163,12 @@ class DualSelectableCombobox(tk.Toplevel):
         selected_index = self.available_listbox.curselection()
         if selected_index:
             value = self.available_listbox.get(selected_index)
-            if value not in self.selected_values:
+            if value not in self._selected_set:
                 self.selected_values.append(value)
+                self._selected_set.add(value)
                 self.selected_listbox.insert(tk.END, value)
                 self.available_listbox.delete(selected_index)
+                del self._displayed[selected_index[0]]
 
     def add_to_selected_double_click(self, event: tk.Event) -> None:
         """Add to selected listbox on double-click."""
@@ -146,12 +182,14 @@ class DualSelectableCombobox(tk.Toplevel):
         selected_index = self.selected_listbox.curselection()
         if selected_index:
             value = self.selected_listbox.get(selected_index)
-            if value in self.selected_values:
-                self.selected_values.remove(value)
+            if value in self._selected_set:
+                del self.selected_values[selected_index[0]]
+                self._selected_set.discard(value)
                 self.selected_listbox.delete(selected_index)
                 self.available_listbox.insert(
                     0, value
                 )  # Insert at the top for better user experience
+                self._displayed.insert(0, value)
 
     def move_selected_up(self) -> None:
         """Move the selected item up in the order."""
@@ -164,7 +202,7 @@ class DualSelectableCombobox(tk.Toplevel):
                 self.selected_values[idx - 1],
                 self.selected_values[idx],
             )
-            self.update_selected_listbox(idx - 1)
+            self.update_selected_listbox(idx, idx - 1)
 
     def move_selected_down(self) -> None:
         """Move the selected item down in the order."""
@@ -177,13 +215,13 @@ class DualSelectableCombobox(tk.Toplevel):
                 self.selected_values[idx + 1],
                 self.selected_values[idx],
             )
-            self.update_selected_listbox(idx + 1)
+            self.update_selected_listbox(idx, idx + 1)
 
-    def update_selected_listbox(self, highlight_index: int) -> None:
-        """Update the selected listbox with the current order and highlight an item."""
-        self.selected_listbox.delete(0, tk.END)
-        for val in self.selected_values:
-            self.selected_listbox.insert(tk.END, val)
+    def update_selected_listbox(self, from_index: int, highlight_index: int) -> None:
+        """Move one row of the selected listbox to its new position and highlight it."""
+        value = self.selected_listbox.get(from_index)
+        self.selected_listbox.delete(from_index)
+        self.selected_listbox.insert(highlight_index, value)
         self.selected_listbox.select_set(highlight_index)
         self.selected_listbox.see(
             highlight_index
@@ -191,6 +229,9 @@ class DualSelectableCombobox(tk.Toplevel):
 
     def confirm_selection(self) -> List[str]:
         """Return the selected values and destroy the window"""
+        if self._pending_filter_id is not None:
+            self.after_cancel(self._pending_filter_id)
+            self._pending_filter_id = None
         self.destroy()
         return self.selected_values
 
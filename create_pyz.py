@@ -11,25 +11,45 @@ OUTPUT_FILE = "pipesim-pilot.pyz"
 ENTRY_POINT = "app.__main__:main"  # Ensure this points to the correct main function
 
 
-def create_pyz():
-    """Creates a .pyz file using zipapp with a specific interpreter."""
-    if not os.path.exists(SOURCE_DIR):
-        print(f"❌ Error: Source directory '{SOURCE_DIR}' does not exist!")
+def build(
+    source_dir: str,
+    output: str,
+    interpreter: str,
+    compressed: bool = False,
+):
+    """
+    Creates a .pyz file from source_dir using zipapp with a specific interpreter.
+
+    Args:
+        source_dir (str): Folder containing the app and pyarmor_runtime.
+        output (str): Path of the .pyz file to create.
+        interpreter (str): Python interpreter written to the shebang line.
+        compressed (bool): Deflate the archive members. Off by default since the
+            .pyz is run from a local folder and storing is much faster to build.
+    """
+    if not os.path.exists(source_dir):
+        print(f"❌ Error: Source directory '{source_dir}' does not exist!")
         sys.exit(1)
 
-    print(f" Creating {OUTPUT_FILE} from '{SOURCE_DIR}'...")
+    print(f" Creating {output} from '{source_dir}'...")
 
     try:
         zipapp.create_archive(
-            SOURCE_DIR,
-            OUTPUT_FILE,
-            interpreter=PYTHON_INTERPRETER,
+            source_dir,
+            output,
+            interpreter=interpreter,
+            compressed=compressed,
         )
-        print(f"✅ Successfully created '{OUTPUT_FILE}'")
+        print(f"✅ Successfully created '{output}'")
         print("Copy the .pyz file to the PANDORA downloads folder")
     except Exception as e:
         print(f"❌ Failed to create .pyz: {e}")
 
 
+def create_pyz(compressed: bool = False):
+    """Creates the pipesim-pilot .pyz with the configured paths."""
+    build(SOURCE_DIR, OUTPUT_FILE, PYTHON_INTERPRETER, compressed=compressed)
+
+
 if __name__ == "__main__":
-    create_pyz()
+    create_pyz(compressed="--compress" in sys.argv[1:])